@@ -0,0 +1,299 @@
+"""
+Headless benchmark for FlashGameManager.
+
+Runs the real FlashGameManager window under QT_QPA_PLATFORM=offscreen against local stand-ins for the
+db-api /search and /addapps endpoints and the infinity image server, then prints the timings as JSON
+so runs can be compared:
+
+    python benchmark.py --latency-ms 80 --output bench.json
+
+Every run uses a fresh data folder, so caches start cold.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import urllib.parse
+import zlib
+
+# Defaults for the stand-in servers and the measurements
+DEFAULT_LATENCY_MS = 50
+DEFAULT_RESULTS = 300  # Games the fake /search has for any query
+DEFAULT_DESCRIPTION_BYTES = 500
+DEFAULT_IMAGE_SIZE = 512  # Width and height in pixels of the fake logos; screenshots are twice as wide
+DEFAULT_COLLECTION_SIZES = "100,1000,10000"
+DEFAULT_REPEAT = 5
+WAIT_TIMEOUT = 30  # Seconds before a measurement is given up on
+
+
+class FakeServerHandler(BaseHTTPRequestHandler):
+    """Serves /search, /addapps and /images/... with a fixed delay; configured through the class attributes."""
+    latency = DEFAULT_LATENCY_MS / 1000
+    results = DEFAULT_RESULTS
+    description_bytes = DEFAULT_DESCRIPTION_BYTES
+    logo_png = b""
+    screenshot_png = b""
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        url = urllib.parse.urlparse(self.path)
+        query = urllib.parse.parse_qs(url.query)
+        if url.path == "/search":
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query.get("limit", ["100"])[0])
+            term = query.get("smartSearch", [""])[0]
+            games = [self.fake_game(term, i) for i in range(offset, min(offset + limit, self.results))]
+            self.send_body(json.dumps(games).encode(), "application/json")
+        elif url.path == "/addapps":
+            apps = [{"name": "Play", "applicationPath": "FPSoftware/Flash/flashplayer.exe", "launchCommand": "http://example.com/game.swf"}]
+            self.send_body(json.dumps(apps).encode(), "application/json")
+        elif url.path.startswith("/images/Logos/"):
+            self.send_body(self.logo_png, "image/png")
+        elif url.path.startswith("/images/Screenshots/"):
+            self.send_body(self.screenshot_png, "image/png")
+        else:
+            self.send_error(404)
+
+    def send_body(self, body: bytes, content_type: str):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    @classmethod
+    def fake_game(cls, term: str, index: int) -> dict:
+        return make_game(f"{zlib.crc32(term.encode()):08x}", index, f"{term} game {index}", cls.description_bytes)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_game(prefix: str, index: int, title: str, description_bytes: int) -> dict:
+    return {
+        "id": f"{prefix}-0000-4000-8000-{index:012d}",
+        "title": title,
+        "developer": "Benchmark Developer",
+        "publisher": "Benchmark Publisher",
+        "platform": "Flash" if index % 3 else "HTML5",
+        "library": "arcade",
+        "tags": ["Action", "Puzzle"],
+        "originalDescription": ("lorem ipsum " * (description_bytes // 12 + 1))[:description_bytes],
+        "dateAdded": "2020-01-01T00:00:00.000Z",
+        "dateModified": "2020-01-01T00:00:00.000Z",
+    }
+
+
+def start_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeServerHandler)
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def fake_png(width: int, height: int) -> bytes:
+    from PyQt5 import QtCore, QtGui
+    image = QtGui.QImage(width, height, QtGui.QImage.Format_RGB32)
+    for y in range(height):
+        for x in range(0, width, 8):
+            image.setPixel(x, y, (x * 2654435761 + y * 40503) & 0xFFFFFF)  # Noise, so the PNG doesn't compress away
+    buffer = QtCore.QBuffer()
+    buffer.open(QtCore.QIODevice.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(buffer.data())
+
+
+def wait_until(app, predicate, timeout=WAIT_TIMEOUT):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("Timed out waiting for the app")
+        app.processEvents()
+        time.sleep(0.0005)
+
+
+def summarize(samples: list) -> dict:
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+        "max_ms": round(max(samples), 2),
+        "samples": len(samples),
+    }
+
+
+def measure_search(app, window, manager, repeat: int) -> dict:
+    """Time from pressing Enter to the first card, and to its icon, for cold and repeated queries."""
+    first_card, first_icon, cached = [], [], []
+    for run in range(repeat):
+        query = f"benchmark query {run}"
+        window.search_input.setText(query)
+        started = time.perf_counter()
+        window.search_game()
+        wait_until(app, lambda: window.results_model.rowCount() > 0)
+        app.processEvents()
+        first_card.append((time.perf_counter() - started) * 1000)
+
+        first_id = window.results_model.index(0, 0).data(manager.GameListModel.GameRole)['id']
+        wait_until(app, lambda: window.thumbnails.get(manager.ICON_THUMBNAIL, first_id) is not None)
+        first_icon.append((time.perf_counter() - started) * 1000)
+
+    # The same queries again come from the response cache
+    for run in range(repeat):
+        window.results_model.clear()
+        window.search_input.setText(f"benchmark query {run}")
+        started = time.perf_counter()
+        window.search_game()
+        wait_until(app, lambda: window.results_model.rowCount() > 0)
+        app.processEvents()
+        cached.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "search_to_first_card": summarize(first_card),
+        "search_to_first_icon": summarize(first_icon),
+        "search_to_first_card_cached": summarize(cached),
+    }
+
+
+def measure_suggestions(app, window) -> dict:
+    """Time each keystroke's suggestion lookup, including the popup update."""
+    samples = []
+    text = "benchmark query 1"
+    for length in range(1, len(text) + 1):
+        started = time.perf_counter()
+        window.on_search_text_edited(text[:length])
+        app.processEvents()
+        samples.append((time.perf_counter() - started) * 1000)
+    window.search_debounce.stop()
+    return {"keystroke_suggestions": summarize(samples), "indexed_titles": len(window.title_index)}
+
+
+def measure_page_append(app, window, manager, pages: int, description_bytes: int) -> dict:
+    """Time display_games_for_search_page for successive pages, including the repaint."""
+    window.display_games_for_search_page(1, [make_game("a99e0000", i, f"Append {i}", description_bytes) for i in range(manager.PAGE_SIZE)])
+    app.processEvents()
+    samples = []
+    for page in range(2, pages + 2):
+        games = [make_game("a99e0000", page * manager.PAGE_SIZE + i, f"Append {i}", description_bytes) for i in range(manager.PAGE_SIZE)]
+        started = time.perf_counter()
+        window.display_games_for_search_page(page, games)
+        app.processEvents()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"page_append": summarize(samples), "rows_after_append": window.results_model.rowCount()}
+
+
+def measure_my_games(app, window, sizes: list, repeat: int, description_bytes: int) -> dict:
+    """Time update_my_games_view filtering and clearing the filter for collections of each size."""
+    window.tabs.setCurrentWidget(window.my_games_tab)
+    app.processEvents()
+    results = {}
+    for size in sizes:
+        window.my_games_model.set_games([make_game("c011ec70", i, f"Saved game {i}", description_bytes) for i in range(size)])
+        app.processEvents()
+        filter_samples, clear_samples = [], []
+        for _ in range(repeat):
+            for text, samples in (("game 7", filter_samples), ("", clear_samples)):
+                window.filter_input.blockSignals(True)
+                window.filter_input.setText(text)
+                window.filter_input.blockSignals(False)
+                started = time.perf_counter()
+                window.update_my_games_view()
+                app.processEvents()
+                samples.append((time.perf_counter() - started) * 1000)
+        results[str(size)] = {"filter": summarize(filter_samples), "clear_filter": summarize(clear_samples)}
+    window.tabs.setCurrentWidget(window.search_tab)
+    return {"update_my_games_view": results}
+
+
+def measure_details(app, window, manager, repeat: int, description_bytes: int) -> dict:
+    """Time opening Details until it is drawn, until the additional apps arrive and until the screenshot does."""
+    opened, apps, screenshots = [], [], []
+    for run in range(repeat):
+        game = make_game("de7a1150", run, f"Details {run}", description_bytes)
+        started = time.perf_counter()
+        window.show_game_details(game)
+        app.processEvents()
+        opened.append((time.perf_counter() - started) * 1000)
+        wait_until(app, lambda: game['id'] in window.additional_apps_cache)
+        apps.append((time.perf_counter() - started) * 1000)
+        wait_until(app, lambda: window.thumbnails.get(manager.SCREENSHOT_THUMBNAIL, game['id']) is not None)
+        screenshots.append((time.perf_counter() - started) * 1000)
+    return {
+        "details_open": summarize(opened),
+        "details_additional_apps": summarize(apps),
+        "details_screenshot": summarize(screenshots),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FlashGameManager against local stand-in servers.")
+    parser.add_argument("--latency-ms", type=float, default=DEFAULT_LATENCY_MS, help="delay added to every fake server response")
+    parser.add_argument("--results", type=int, default=DEFAULT_RESULTS, help="games returned by the fake /search")
+    parser.add_argument("--description-bytes", type=int, default=DEFAULT_DESCRIPTION_BYTES, help="size of each game's description")
+    parser.add_argument("--image-size", type=int, default=DEFAULT_IMAGE_SIZE, help="width and height of the fake logos in pixels")
+    parser.add_argument("--collection-sizes", default=DEFAULT_COLLECTION_SIZES, help="comma-separated My Games sizes to measure")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="samples per measurement")
+    parser.add_argument("--output", help="write the JSON results here instead of stdout")
+    args = parser.parse_args()
+
+    # The app reads these at import time, so they are set before manager is imported
+    data_home = tempfile.mkdtemp(prefix="flash_game_manager_bench_")
+    os.environ["XDG_DATA_HOME"] = data_home
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    server = start_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ["FLASH_GAME_MANAGER_DB_API_URL"] = base_url
+    os.environ["FLASH_GAME_MANAGER_INFINITY_URL"] = base_url
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import manager
+    from PyQt5 import QtWidgets
+
+    app = QtWidgets.QApplication(sys.argv)
+    FakeServerHandler.latency = args.latency_ms / 1000
+    FakeServerHandler.results = args.results
+    FakeServerHandler.description_bytes = args.description_bytes
+
+    window = manager.FlashGameManager()
+    window.show()
+    wait_until(app, lambda: window.startup_profiler.finished)
+    # Made after startup, which is timed from the import of manager
+    FakeServerHandler.logo_png = fake_png(args.image_size, args.image_size)
+    FakeServerHandler.screenshot_png = fake_png(args.image_size * 2, args.image_size)
+
+    results = {"startup_ms": round(window.startup_profiler.total_ms(), 2)}
+    results.update(measure_search(app, window, manager, args.repeat))
+    results.update(measure_suggestions(app, window))
+    results.update(measure_page_append(app, window, manager, args.results // manager.PAGE_SIZE, args.description_bytes))
+    sizes = [int(size) for size in args.collection_sizes.split(",") if size]
+    results.update(measure_my_games(app, window, sizes, args.repeat, args.description_bytes))
+    results.update(measure_details(app, window, manager, args.repeat, args.description_bytes))
+    results["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+    report = {
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": vars(args),
+        "results": results,
+    }
+    output = json.dumps(report, indent=4)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    server.shutdown()
+    # Worker pools and the job queue would otherwise keep the process alive
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,27 @@ gamedata_path="games"
 legacy_path="games/legacy"
 database_file="database/flashpoint.sqlite"
 gameserver_file="software/server/FlashpointGameServer"
+progress_path="progress"
+plan_path="plans"
+database_sync_state_file="database/sync.state"
+database_etag_path="database/etags"
+
+# Keep the game server running between launches; the daemon exits after this many idle seconds
+daemon_enabled=true
+daemon_path="run"
+daemon_idle_timeout=1800
+
+# Gamedata larger than twice the minimum chunk size is downloaded as this many parallel ranges
+download_chunks=4
+download_min_chunk_size=$((4 * 1024 * 1024))
+
+# Downloads slower than download_min_speed bytes per second for download_slow_time seconds switch mirrors
+download_min_speed=51200
+download_slow_time=15
+
+# Per-mirror latency and throughput history used to rank sources; the top mirror_hedge_count are raced
+mirror_stats_file="mirrors.stats"
+mirror_hedge_count=2
 
 gamedata_sources=(
 	"https://download.unstable.life/gib-roms/Games"
@@ -0,0 +1,171 @@
+#!/usr/bin/env bash
+
+# Launcher daemon, sourced by flashpoint.sh after mirrors.sh.
+#
+# `flashpoint.sh --daemon` keeps FlashpointGameServer running and takes requests on the FIFO
+# $daemon_path/daemon.fifo, one line each: "<command> <reply fifo> [argument] [owner pid]". Commands
+# are ping, mount <gamedata file>, unmount <gamedata file> and stop; every request is answered on its
+# reply FIFO with "ok <milliseconds taken>". Zips stay mounted while any launch is using them, and the
+# daemon exits after $daemon_idle_timeout seconds without requests once nothing is mounted. A mount
+# whose owner has died without unmounting (a launcher killed with the game) is released on its own.
+
+daemon_enabled=${daemon_enabled:-true}
+daemon_path=${daemon_path:-run}
+daemon_idle_timeout=${daemon_idle_timeout:-1800}
+daemon_request_timeout=${daemon_request_timeout:-30}
+daemon_fifo="$daemon_path/daemon.fifo"
+daemon_pid_file="$daemon_path/daemon.pid"
+gameserver_url="http://localhost:22501"
+
+function gameserver_start {
+    "$script_dir/$gameserver_file" -rootPath= -gameRootPath="$gamedata_path" -legacyHTDOCSPath="$legacy_path" -handleLegacyRequests=true -useInfinityServer=true &
+    gameserver_pid=$!
+}
+
+# Waits up to ten seconds for the game server to answer HTTP requests
+function gameserver_wait_ready {
+    local i
+    for ((i = 0; i < 100; i++)); do
+        curl -s -o /dev/null "$gameserver_url/" && return 0
+        sleep 0.1
+    done
+    return 1
+}
+
+function gameserver_mount {
+    curl -s -X POST -d "{\"filePath\":\"$1\"}" "$gameserver_url/fpProxy/api/mountzip" > /dev/null
+}
+
+# Not every game server build can unmount; a zip left mounted is harmless and stays warm
+function gameserver_unmount {
+    curl -s -X POST -d "{\"filePath\":\"$1\"}" "$gameserver_url/fpProxy/api/unmountzip" > /dev/null
+}
+
+function daemon_alive {
+    [[ -p $daemon_fifo && -f $daemon_pid_file ]] && kill -0 "$(< "$daemon_pid_file")" 2> /dev/null
+}
+
+# Usage: daemon_request <command> [argument] [owner pid]
+# Prints the milliseconds the daemon took, or fails if it did not answer in time
+function daemon_request {
+    local reply reply_fd status elapsed
+    reply=$(mktemp -u "$daemon_path/reply.XXXXXX")
+    mkfifo "$reply" || return 1
+
+    # Both FIFOs are opened read-write so that neither side can block on a missing peer
+    exec {reply_fd}<> "$reply"
+    echo "$1 $reply ${2:-} ${3:-}" 1<> "$daemon_fifo"
+    read -t $daemon_request_timeout -r status elapsed <&$reply_fd
+    exec {reply_fd}<&-
+    rm -f "$reply"
+
+    [[ $status == ok ]] && echo $elapsed
+}
+
+# Starts a detached daemon unless one is running, and waits until it answers
+function daemon_ensure {
+    daemon_started=false
+    daemon_alive && daemon_request ping > /dev/null && return 0
+    daemon_started=true
+
+    echo "$0: starting launcher daemon"
+    setsid "$script_dir/flashpoint.sh" --daemon < /dev/null > /dev/null 2>&1 &
+    local i
+    for ((i = 0; i < 100; i++)); do
+        sleep 0.1
+        daemon_alive && daemon_request ping > /dev/null && return 0
+    done
+    return 1
+}
+
+# Usage: daemon_release_mount <gamedata file> <owner pid>
+# Drops one use of the zip by owner, unmounting it once nobody uses it; works on daemon_run's mounts
+function daemon_release_mount {
+    [[ -z ${mounts[$1]} ]] && return
+    local owners=(${mounts[$1]}) i
+    # An owner that is not listed still releases one use, as an unmount did before owners were tracked
+    local release=0
+    for ((i = 0; i < ${#owners[@]}; i++)); do
+        if [[ ${owners[$i]} == $2 ]]; then
+            release=$i
+            break
+        fi
+    done
+    unset "owners[$release]"
+    if (( ${#owners[@]} == 0 )); then
+        gameserver_unmount "$1"
+        unset "mounts[$1]"
+    else
+        mounts[$1]="${owners[*]}"
+    fi
+}
+
+function daemon_release_dead_mounts {
+    local file owner
+    for file in "${!mounts[@]}"; do
+        for owner in ${mounts[$file]}; do
+            (( owner > 0 )) && ! kill -0 $owner 2> /dev/null && daemon_release_mount "$file" $owner
+        done
+    done
+}
+
+function daemon_run {
+    mkdir -p "$daemon_path"
+    if daemon_alive; then
+        echo "$0: launcher daemon is already running"
+        return 0
+    fi
+    rm -f "$daemon_fifo"
+    mkfifo "$daemon_fifo" || return 1
+    # Open the FIFO right away so requests sent while the game server starts are queued, not lost
+    exec 3<> "$daemon_fifo"
+    echo $$ > "$daemon_pid_file"
+    trap 'kill $gameserver_pid 2> /dev/null; rm -f "$daemon_fifo" "$daemon_pid_file"' EXIT
+
+    gameserver_start
+    if ! gameserver_wait_ready; then
+        echo "$0: game server did not start"
+        return 1
+    fi
+    echo "$0: launcher daemon ready"
+
+    local command reply file owner started reply_fd
+    # Each mounted zip maps to the launcher PIDs using it, one entry per mount request; 0 stands for
+    # a launcher that did not say who it was and is only released by its unmount
+    declare -A mounts
+    while true; do
+        if ! read -t $daemon_idle_timeout -r command reply file owner <&3; then
+            daemon_release_dead_mounts
+            (( ${#mounts[@]} == 0 )) && break
+            continue
+        fi
+        started=$(mirror_now_ms)
+
+        # Bring the game server back if it died between launches
+        if ! kill -0 $gameserver_pid 2> /dev/null; then
+            echo "$0: restarting game server"
+            gameserver_start
+            gameserver_wait_ready
+            mounts=()
+        fi
+
+        case $command in
+            mount)
+                [[ -z ${mounts[$file]} ]] && gameserver_mount "$file"
+                mounts[$file]="${mounts[$file]} ${owner:-0}"
+                ;;
+            unmount)
+                daemon_release_mount "$file" "${owner:-0}"
+                ;;
+        esac
+        daemon_release_dead_mounts
+
+        if [[ -p $reply ]]; then
+            exec {reply_fd}<> "$reply"
+            echo "ok $(( $(mirror_now_ms) - started ))" >&$reply_fd
+            exec {reply_fd}<&-
+        fi
+        [[ $command == stop ]] && break
+    done
+    echo "$0: launcher daemon stopped"
+}
@@ -0,0 +1,86 @@
+#!/usr/bin/env bash
+
+# Database sync, sourced by flashpoint.sh after mirrors.sh.
+#
+# Each mirror is asked for the database conditionally, using the ETag it sent last time and the
+# modification time of the local copy, so an unchanged database costs a single 304 response. A
+# changed database is streamed with transfer compression into a temporary file, checked, and renamed
+# over the old one; programs that already have the old file open keep reading it until they reopen.
+# The outcome of the last sync is written to $database_sync_state_file.
+
+database_sync_state_file=${database_sync_state_file:-database/sync.state}
+database_etag_path=${database_etag_path:-database/etags}
+
+function database_record_sync {
+    local state="$database_sync_state_file"
+    mkdir -p "${state%/*}"
+    {
+        echo "synced_at=$(date +%s)"
+        echo "result=$2"
+        echo "source=$1"
+        echo "size=$(download_file_size "$database_file")"
+        echo "modified_at=$(stat -c %Y "$database_file")"
+    } > "$state.tmp" && mv -f "$state.tmp" "$state"
+}
+
+# Usage: database_sync <sources...>
+function database_sync {
+    local ranked=() source
+    readarray -t ranked < <(mirror_rank "$@")
+    mkdir -p "${database_file%/*}" "$database_etag_path"
+    local partial="$database_file.part"
+
+    # Only one sync at a time; a second caller waits and then finds the database unchanged
+    exec 8> "$database_file.lock"
+    flock 8
+
+    for source in "${ranked[@]}"; do
+        local etag_file="$database_etag_path/${source//[^A-Za-z0-9]/_}"
+        local conditions=()
+        if [[ -f $database_file ]]; then
+            conditions=(-z "$database_file")
+            [[ -f $etag_file ]] && conditions+=(--etag-compare "$etag_file")
+        fi
+
+        echo "$0: syncing database from $source"
+        local result
+        result=$(curl -sfL --compressed -R "${conditions[@]}" --etag-save "$etag_file.new" \
+            --speed-limit $download_min_speed --speed-time $download_slow_time \
+            -o "$partial" -w '%{http_code} %{time_starttransfer} %{speed_download}' "$source")
+        if [[ $? != 0 ]]; then
+            rm -f "$partial" "$etag_file.new"
+            mirror_record "$source" - - false
+            echo "$0: failed to download from desired source"
+            continue
+        fi
+
+        local code latency speed
+        read -r code latency speed <<< "$result"
+        if [[ $code == 304 ]]; then
+            rm -f "$partial" "$etag_file.new"
+            mirror_record "$source" $(awk '{ printf "%d", $1 * 1000 }' <<< "$latency") - true
+            database_record_sync "$source" unchanged
+            echo "$0: database is up to date"
+            flock -u 8
+            return 0
+        fi
+        mirror_record "$source" $(awk '{ printf "%d", $1 * 1000 }' <<< "$latency") ${speed%.*} true
+
+        if [[ $(sqlite3 "file:$partial?mode=ro" "pragma quick_check" 2> /dev/null) != ok ]]; then
+            rm -f "$partial" "$etag_file.new"
+            mirror_record "$source" - - false
+            echo "$0: database from $source is invalid"
+            continue
+        fi
+
+        mv -f "$etag_file.new" "$etag_file"
+        mv -f "$partial" "$database_file"
+        database_record_sync "$source" updated
+        echo "$0: database updated"
+        flock -u 8
+        return 0
+    done
+
+    flock -u 8
+    return 1
+}
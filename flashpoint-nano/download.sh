@@ -0,0 +1,158 @@
+#!/usr/bin/env bash
+
+# Download engine for gamedata zips, sourced by flashpoint.sh.
+#
+# Large files are fetched as parallel HTTP range requests into numbered part files, which are
+# resumed on the next attempt if the transfer is interrupted. The assembled file is only renamed
+# into place once its size and SHA-256 match, so a truncated zip is never mounted. Progress is
+# written to $download_progress_file (if set) as "<state> <downloaded bytes> <total bytes>".
+# Transfers that stay below $download_min_speed bytes per second for $download_slow_time seconds are
+# abandoned, leaving their partial files for the next mirror to resume.
+
+download_chunks=${download_chunks:-4}
+download_min_chunk_size=${download_min_chunk_size:-$((4 * 1024 * 1024))}
+download_min_speed=${download_min_speed:-51200}
+download_slow_time=${download_slow_time:-15}
+progress_path=${progress_path:-progress}
+
+function download_report {
+    [[ ${#download_progress_file} == 0 ]] && return
+    mkdir -p "${download_progress_file%/*}"
+    echo "$1 ${2:-0} ${3:-0}" > "$download_progress_file.tmp" && mv -f "$download_progress_file.tmp" "$download_progress_file"
+}
+
+function download_file_size {
+    if [[ -f $1 ]]; then stat -c %s "$1"; else echo 0; fi
+}
+
+# Prints the size of $1 if the server reports one and accepts range requests
+function download_ranged_size {
+    local headers
+    headers=$(curl -sfIL "$1") || return 1
+    headers=${headers//$'\r'/}
+    grep -qi '^accept-ranges: *bytes' <<< "$headers" || return 1
+    grep -i '^content-length:' <<< "$headers" | tail -n 1 | awk '{print $2}'
+}
+
+# Reports the combined size of the given files once a second until killed
+function download_watch {
+    local total=$1
+    shift
+    while true; do
+        local downloaded=0 file
+        for file in "$@"; do
+            downloaded=$((downloaded + $(download_file_size "$file")))
+        done
+        download_report downloading $downloaded $total
+        sleep 1
+    done
+}
+
+function download_verify {
+    local file=$1 sha256=$2 size=$3
+    if [[ ${#size} > 0 && $(download_file_size "$file") != $size ]]; then
+        echo "$0: size mismatch for $file"
+        return 1
+    fi
+    [[ ${#sha256} == 0 ]] && return 0
+    local actual
+    actual=$(sha256sum "$file" | cut -d ' ' -f 1)
+    if [[ ${actual,,} != ${sha256,,} ]]; then
+        echo "$0: checksum mismatch for $file"
+        return 1
+    fi
+}
+
+# Downloads $1 into $2 as $download_chunks parallel ranges of a $3-byte file
+function download_chunked {
+    local url=$1 partial=$2 size=$3
+    local chunk_size=$(( (size + download_chunks - 1) / download_chunks ))
+    local parts=() expected_sizes=() pids=() i
+
+    for ((i = 0; i < download_chunks; i++)); do
+        local start=$((i * chunk_size))
+        (( start >= size )) && break
+        local end=$((start + chunk_size - 1))
+        (( end >= size )) && end=$((size - 1))
+        local part="$partial.$i"
+        local expected=$((end - start + 1))
+        local have
+        have=$(download_file_size "$part")
+        (( have > expected )) && { rm -f "$part"; have=0; }
+
+        parts+=("$part")
+        expected_sizes+=($expected)
+        if (( have < expected )); then
+            # Resume the range where the previous attempt stopped
+            curl -sf --speed-limit $download_min_speed --speed-time $download_slow_time -r "$((start + have))-$end" "$url" >> "$part" &
+            pids+=($!)
+        fi
+    done
+
+    download_watch $size "${parts[@]}" &
+    local watcher=$! failed=false pid
+    for pid in "${pids[@]}"; do
+        wait $pid || failed=true
+    done
+    kill $watcher 2> /dev/null
+    wait $watcher 2> /dev/null
+    [[ $failed == true ]] && return 1
+
+    for i in "${!parts[@]}"; do
+        if [[ $(download_file_size "${parts[$i]}") != ${expected_sizes[$i]} ]]; then
+            # The server ignored the range or sent garbage; start this part over next time
+            rm -f "${parts[$i]}"
+            return 1
+        fi
+    done
+    cat "${parts[@]}" > "$partial" && rm -f "${parts[@]}"
+}
+
+# Downloads $1 into $2 as a single resumable stream
+function download_single {
+    local url=$1 partial=$2 size=$3
+    download_watch ${size:-0} "$partial" &
+    local watcher=$!
+    curl -sf --speed-limit $download_min_speed --speed-time $download_slow_time -C - -o "$partial" "$url"
+    local status=$?
+    kill $watcher 2> /dev/null
+    wait $watcher 2> /dev/null
+    return $status
+}
+
+# Usage: download_gamedata <url> <destination> [sha256] [size]
+function download_gamedata {
+    local url=$1 destination=$2 sha256=$3 size=$4
+    local partial="$destination.part"
+    mkdir -p "${destination%/*}"
+
+    local ranged_size
+    ranged_size=$(download_ranged_size "$url")
+    [[ ${#size} == 0 ]] && size=$ranged_size
+
+    # A complete but unverified file may be left over from an earlier attempt
+    if [[ ${#size} > 0 && $(download_file_size "$partial") -ge $size ]]; then
+        download_verify "$partial" "$sha256" "$size" || rm -f "$partial"
+    fi
+
+    if [[ ! -f $partial || ${#size} == 0 || $(download_file_size "$partial") -lt $size ]]; then
+        if [[ ${#ranged_size} > 0 && $ranged_size == $size ]] && (( size >= 2 * download_min_chunk_size )); then
+            rm -f "$partial"
+            download_chunked "$url" "$partial" "$size" || { download_report failed 0 ${size:-0}; return 1; }
+        else
+            # Only resume a single stream if the server can continue from an offset
+            [[ ${#ranged_size} == 0 ]] && rm -f "$partial"
+            download_single "$url" "$partial" "$size" || { download_report failed 0 ${size:-0}; return 1; }
+        fi
+    fi
+
+    download_report verifying $(download_file_size "$partial") ${size:-0}
+    if ! download_verify "$partial" "$sha256" "$size"; then
+        rm -f "$partial" "$partial".*
+        download_report failed 0 ${size:-0}
+        return 1
+    fi
+
+    mv -f "$partial" "$destination"
+    download_report done ${size:-0} ${size:-0}
+}
@@ -7,6 +7,7 @@ script_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 exec > >(tee -a /tmp/flashpoint.log) 2>&1
 
 unset LD_PRELOAD
+launch_started=$(( $(date +%s%N) / 1000000 ))
 
 echo "Script started at: $(date)"
 echo "Current working directory: $(pwd)"
@@ -15,6 +16,10 @@ echo "Arguments: $@"
 
 # Source the configuration file from the script directory
 source "$script_dir/config.sh"
+source "$script_dir/download.sh"
+source "$script_dir/mirrors.sh"
+source "$script_dir/database.sh"
+source "$script_dir/daemon.sh"
 
 function error_unspecified_id {
     echo "$0: no ID was specified"
@@ -32,100 +37,198 @@ function error_unsupported_entry {
     echo "$0: no applicable overrides for entry with ID $entry_id"
     exit 1
 }
+function error_mount_failed {
+    echo "$0: the launcher daemon did not mount $entry_gamedata_file; stop it with --stop-daemon and try again"
+    exit 1
+}
 function error_all_downloads_failed {
     echo "$0: all attempts to download $1 were unsuccessful"
     exit 1
 }
 
+# With --daemon, keep the game server running for later launches; --stop-daemon stops it
+if [[ $1 == --daemon ]]; then
+    daemon_run
+    exit $?
+fi
+if [[ $1 == --stop-daemon ]]; then
+    daemon_alive && daemon_request stop > /dev/null
+    exit 0
+fi
+
+# With --sync-database, only bring the database up to date
+if [[ $1 == --sync-database ]]; then
+    database_sync "${database_sources[@]}" || error_all_downloads_failed "$database_file"
+    exit 0
+fi
+
+# With --download, only fetch and verify the entry's gamedata without launching it; with --resolve,
+# only work out how to launch the entry and save that as its launch plan
+download_only=false
+resolve_only=false
+if [[ $1 == --download ]]; then
+    download_only=true
+    shift
+elif [[ $1 == --resolve ]]; then
+    resolve_only=true
+    shift
+fi
+
 [[ ${#1} == 0 ]] && error_unspecified_id
 entry_id=$1
 addapp_id=$2
 
-[[ ! -d $database_file ]] && mkdir -p "${database_file%/*}"
-if [[ ! -f $database_file ]]; then
-    for database_source in ${database_sources[@]}; do
-        echo "$0: downloading $database_source"
-        curl "$database_source" -sfo "$database_file"
+function download_entry_gamedata {
+    [[ $entry_is_legacy == true || -f "$gamedata_path/$entry_gamedata_file" ]] && return
 
-        [[ $? == 0 ]] && break
-        echo "$0: failed to download from desired source"
-    done
+    download_progress_file="$progress_path/$entry_id"
+    mirror_download "$entry_gamedata_file" "$gamedata_path/$entry_gamedata_file" "$entry_gamedata_sha256" "$entry_gamedata_size" "${gamedata_sources[@]}"
 
-    [[ ! -f $database_file ]] && error_all_downloads_failed "$database_file"
-fi
+    [[ ! -f "$gamedata_path/$entry_gamedata_file" ]] && error_all_downloads_failed "$entry_gamedata_file"
+}
 
-echo "$0: querying database for entry properties corresponding to ID $entry_id"
-entry_query=$(sqlite3 --separator $'\n' "file:${database_file}?mode=ro" ".param set :id $entry_id" "select game_data.path, game.platformName, coalesce(game_data.applicationPath, game.applicationPath), coalesce(game_data.launchCommand, game.launchCommand) from game left join game_data on game.id = game_data.gameId where game.id = :id" 2> /dev/null)
-[[ $? > 0 ]] && error_invalid_database
+# A launch plan holds everything resolved from the database and overrides for one entry. It is only
+# valid for the database file and config.sh it was made from.
+plan_version=1
+plan_path=${plan_path:-plans}
+plan_file="$plan_path/$entry_id${addapp_id:+_$addapp_id}.plan"
 
-readarray -t entry_properties <<< $entry_query
-[[ ${#entry_properties[@]} == 0 ]] && error_invalid_id
+function plan_fingerprint {
+    echo "$plan_version $(stat -c '%i:%s:%Y' "$database_file" 2> /dev/null) $(stat -c '%s:%Y' "$script_dir/config.sh")"
+}
 
-entry_is_legacy=false
-[[ ${#entry_properties[0]} == 0 ]] && entry_is_legacy=true
+function write_launch_plan {
+    mkdir -p "$plan_path"
+    {
+        echo "# $(plan_fingerprint)"
+        declare -p entry_is_legacy entry_gamedata_file entry_primary_platform entry_application_path entry_launch_command entry_gamedata_sha256 entry_gamedata_size
+    } > "$plan_file.tmp" && mv -f "$plan_file.tmp" "$plan_file"
+}
 
-entry_gamedata_file=${entry_properties[0]}
-entry_primary_platform=${entry_properties[1]}
-entry_application_path=${entry_properties[2]//\\//}
-entry_launch_command=${entry_properties[3]}
+plan_loaded=false
+if [[ $resolve_only == false && -f $plan_file ]]; then
+    read -r _ plan_saved_fingerprint < "$plan_file"
+    if [[ $plan_saved_fingerprint == $(plan_fingerprint) ]]; then
+        echo "$0: using saved launch plan for ID $entry_id"
+        source "$plan_file"
+        plan_loaded=true
+    fi
+fi
 
-if [[ ${#addapp_id} > 0 ]]; then
-    echo "$0: querying database for additional app properties corresponding to ID $addapp_id"
-    addapp_query=$(sqlite3 --separator $'\n' "file:${database_file}?mode=ro" ".param set :id $addapp_id" "select applicationPath, launchCommand from additional_app where id = :id" 2> /dev/null)
+if [[ $plan_loaded == false ]]; then
+    [[ ! -d $database_file ]] && mkdir -p "${database_file%/*}"
+    if [[ ! -f $database_file ]]; then
+        # Prefetching gamedata is not worth downloading the whole database for; launching is
+        [[ $download_only == true ]] && error_invalid_database
+        database_sync "${database_sources[@]}"
 
-    readarray -t addapp_properties <<< $addapp_query
-    if [[ ${#addapp_properties[@]} > 0 ]]; then
-        entry_application_path=${addapp_properties[0]//\\//}
-        entry_launch_command=${addapp_properties[1]}
+        [[ ! -f $database_file ]] && error_all_downloads_failed "$database_file"
     fi
+
+    echo "$0: querying database for entry properties corresponding to ID $entry_id"
+    entry_query=$(sqlite3 --separator $'\n' "file:${database_file}?mode=ro" ".param set :id $entry_id" "select game_data.path, game.platformName, coalesce(game_data.applicationPath, game.applicationPath), coalesce(game_data.launchCommand, game.launchCommand), game_data.sha256, game_data.size from game left join game_data on game.id = game_data.gameId where game.id = :id" 2> /dev/null)
+    [[ $? > 0 ]] && error_invalid_database
+
+    [[ ${#entry_query} == 0 ]] && error_invalid_id
+    readarray -t entry_properties <<< $entry_query
+
+    entry_is_legacy=false
+    [[ ${#entry_properties[0]} == 0 ]] && entry_is_legacy=true
+
+    entry_gamedata_file=${entry_properties[0]}
+    entry_primary_platform=${entry_properties[1]}
+    entry_application_path=${entry_properties[2]//\\//}
+    entry_launch_command=${entry_properties[3]}
+    entry_gamedata_sha256=${entry_properties[4]}
+    entry_gamedata_size=${entry_properties[5]}
 fi
 
-found_match=false
-for i in $(seq 0 2 $((${#launch_command_overrides[@]}-1))); do
-    if echo $entry_launch_command | grep -E "${launch_command_overrides[$i]}" > /dev/null; then
-        entry_application_path=${launch_command_overrides[$(($i+1))]}
-        found_match=true
-        break
-    fi
-done
-for i in $(seq 0 2 $((${#application_path_overrides[@]}-1))); do
-    if echo $entry_application_path | grep -E "${application_path_overrides[$i]}" > /dev/null; then
-        entry_application_path=${application_path_overrides[$(($i+1))]}
-        found_match=true
-        break
-    fi
-done
-for i in $(seq 0 2 $((${#platform_overrides[@]}-1))); do
-    if [[ $entry_primary_platform == ${platform_overrides[$i]} ]]; then
-        entry_application_path=${platform_overrides[$(($i+1))]}
-        found_match=true
-        break
+if [[ $download_only == true ]]; then
+    download_entry_gamedata
+    exit 0
+fi
+
+if [[ $plan_loaded == false ]]; then
+    if [[ ${#addapp_id} > 0 ]]; then
+        echo "$0: querying database for additional app properties corresponding to ID $addapp_id"
+        addapp_query=$(sqlite3 --separator $'\n' "file:${database_file}?mode=ro" ".param set :id $addapp_id" "select applicationPath, launchCommand from additional_app where id = :id" 2> /dev/null)
+
+        readarray -t addapp_properties <<< $addapp_query
+        if [[ ${#addapp_properties[@]} > 0 ]]; then
+            entry_application_path=${addapp_properties[0]//\\//}
+            entry_launch_command=${addapp_properties[1]}
+        fi
     fi
-done
-[[ $found_match == false ]] && error_unsupported_entry
 
-if [[ $entry_is_legacy == false ]]; then
-    [[ ! -d $gamedata_path ]] && mkdir -p "$gamedata_path"
-    if [[ ! -f "$gamedata_path/$entry_gamedata_file" ]]; then
-        for gamedata_source in ${gamedata_sources[@]}; do
-            echo "$0: downloading $gamedata_source/$entry_gamedata_file"
-            curl "$gamedata_source/$entry_gamedata_file" -sfo "$gamedata_path/$entry_gamedata_file"
+    found_match=false
+    for ((i = 0; i < ${#launch_command_overrides[@]}; i += 2)); do
+        if [[ $entry_launch_command =~ ${launch_command_overrides[$i]} ]]; then
+            entry_application_path=${launch_command_overrides[$(($i+1))]}
+            found_match=true
+            break
+        fi
+    done
+    for ((i = 0; i < ${#application_path_overrides[@]}; i += 2)); do
+        if [[ $entry_application_path =~ ${application_path_overrides[$i]} ]]; then
+            entry_application_path=${application_path_overrides[$(($i+1))]}
+            found_match=true
+            break
+        fi
+    done
+    for ((i = 0; i < ${#platform_overrides[@]}; i += 2)); do
+        if [[ $entry_primary_platform == ${platform_overrides[$i]} ]]; then
+            entry_application_path=${platform_overrides[$(($i+1))]}
+            found_match=true
+            break
+        fi
+    done
+    [[ $found_match == false ]] && error_unsupported_entry
 
-            [[ $? == 0 ]] && break
-            echo "$0: failed to download from desired source"
-        done
+    write_launch_plan
+fi
 
-        [[ ! -f "$gamedata_path/$entry_gamedata_file" ]] && error_all_downloads_failed "$entry_gamedata_file"
-    fi
+if [[ $resolve_only == true ]]; then
+    echo "$0: saved launch plan to $plan_file"
+    exit 0
 fi
 
-echo "$0: initializing game server"
-(
-    trap "kill 0" SIGINT
-    exec "$script_dir/$gameserver_file" -rootPath= -gameRootPath="$gamedata_path" -legacyHTDOCSPath="$legacy_path" -handleLegacyRequests=true -useInfinityServer=true &
-    [[ $entry_is_legacy == false ]] && curl -X POST -d "{\"filePath\":\"$entry_gamedata_file\"}" http://localhost:22501/fpProxy/api/mountzip &
-    source "$script_dir/$entry_application_path" &
-    wait
-)
+download_entry_gamedata
+
+function report_time_to_ready {
+    local elapsed=$(( $(mirror_now_ms) - launch_started ))
+    echo "$0: ready to launch $entry_id in $elapsed ms ($1 start)"
+    mkdir -p "$daemon_path"
+    echo "$(date +%s) $entry_id $1 $elapsed" >> "$daemon_path/launch_times"
+}
+
+if [[ $daemon_enabled == true ]] && daemon_ensure; then
+    # The daemon's game server is already up, so only the zip needs mounting. It is unmounted however this
+    # script ends; if it is killed outright, the daemon notices this PID is gone and releases the zip itself.
+    if [[ $entry_is_legacy == false ]]; then
+        # Without the zip the game would not load, so give up rather than launch it
+        daemon_request mount "$entry_gamedata_file" $$ > /dev/null || error_mount_failed
+        trap 'daemon_request unmount "$entry_gamedata_file" $$ > /dev/null' EXIT
+        trap 'exit 130' INT
+        trap 'exit 143' TERM
+    fi
+    if [[ $daemon_started == true ]]; then report_time_to_ready cold; else report_time_to_ready warm; fi
+    (
+        trap "kill 0" SIGINT
+        source "$script_dir/$entry_application_path" &
+        wait
+    )
+else
+    echo "$0: initializing game server"
+    (
+        trap "kill 0" SIGINT
+        gameserver_start
+        gameserver_wait_ready
+        [[ $entry_is_legacy == false ]] && gameserver_mount "$entry_gamedata_file"
+        report_time_to_ready inline
+        source "$script_dir/$entry_application_path" &
+        wait $!
+        kill $gameserver_pid
+    )
+fi
 
 echo "Script completed at: $(date)"
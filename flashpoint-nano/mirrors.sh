@@ -0,0 +1,165 @@
+#!/usr/bin/env bash
+
+# Mirror selection, sourced by flashpoint.sh after download.sh.
+#
+# Every transfer records the mirror's first-byte latency and throughput in $mirror_stats_file as a
+# moving average, along with a failure count that halves after each success. Mirrors are ranked by
+# the estimated time to fetch $mirror_rank_size bytes, the best few are raced with a HEAD request and
+# the first to answer is used. Transfers that slow down below $download_min_speed are abandoned by
+# the download engine and resumed from the next mirror in line.
+
+mirror_stats_file=${mirror_stats_file:-mirrors.stats}
+mirror_hedge_count=${mirror_hedge_count:-2}
+mirror_probe_timeout=${mirror_probe_timeout:-10}
+mirror_rank_size=${mirror_rank_size:-$((16 * 1024 * 1024))}
+mirror_failure_penalty=${mirror_failure_penalty:-60000}
+
+# Prints the URL of <path> on <source>, or the source itself if the path is empty
+function mirror_url {
+    echo "$1${2:+/$2}"
+}
+
+function mirror_now_ms {
+    echo $(( $(date +%s%N) / 1000000 ))
+}
+
+# Usage: mirror_record <source> <latency ms or -> <throughput bytes/s or -> <true|false>
+function mirror_record {
+    local source=$1 latency=$2 throughput=$3 succeeded=$4
+    (
+        flock 9
+        touch "$mirror_stats_file"
+        awk -v source="$source" -v latency="$latency" -v throughput="$throughput" -v succeeded="$succeeded" -v now="$(date +%s)" '
+            function blend(old, new) {
+                if (new == "-") return old
+                if (old == "-") return new
+                return int((old * 7 + new * 3) / 10)
+            }
+            $1 == source {
+                found = 1
+                failures = succeeded == "true" ? int($4 / 2) : $4 + 1
+                print source, blend($2, latency), blend($3, throughput), failures, now
+                next
+            }
+            { print }
+            END { if (!found) print source, latency, throughput, succeeded == "true" ? 0 : 1, now }
+        ' "$mirror_stats_file" > "$mirror_stats_file.tmp" && mv -f "$mirror_stats_file.tmp" "$mirror_stats_file"
+    ) 9> "$mirror_stats_file.lock"
+}
+
+# Prints the given sources best first; mirrors without any measurements are tried before the rest
+function mirror_rank {
+    touch "$mirror_stats_file"
+    printf '%s\n' "$@" | awk -v rank_size=$mirror_rank_size -v penalty=$mirror_failure_penalty '
+        FILENAME == ARGV[1] { latency[$1] = $2; throughput[$1] = $3; failures[$1] = $4; next }
+        {
+            score = 0
+            if ($1 in latency) {
+                if (latency[$1] != "-") score += latency[$1]
+                if (throughput[$1] != "-" && throughput[$1] > 0) score += rank_size * 1000 / throughput[$1]
+                score += failures[$1] * penalty
+            }
+            printf "%d %d %s\n", score, FNR, $1
+        }
+    ' "$mirror_stats_file" - | sort -n -k 1,1 -k 2,2 | cut -d ' ' -f 3-
+}
+
+# Usage: mirror_wait_any <pids...>
+# Waits for one of the background jobs to finish and sets finished_pid and finished_status. wait -p
+# needs bash 5.1, so older shells poll the jobs instead; finished_pid is empty if none was waited for.
+function mirror_wait_any {
+    finished_pid=
+    if (( BASH_VERSINFO[0] > 5 || (BASH_VERSINFO[0] == 5 && BASH_VERSINFO[1] >= 1) )); then
+        wait -n -p finished_pid "$@"
+        finished_status=$?
+        return
+    fi
+    local pid
+    while true; do
+        for pid in "$@"; do
+            if ! kill -0 $pid 2> /dev/null; then
+                wait $pid
+                finished_status=$?
+                finished_pid=$pid
+                return
+            fi
+        done
+        sleep 0.05
+    done
+}
+
+# Usage: mirror_race <path> <ranked sources...>
+# Sends a HEAD request for <path> to the top $mirror_hedge_count sources at once and prints all the
+# sources again with the first one to answer moved to the front
+function mirror_race {
+    local path=$1
+    shift
+    local sources=("$@") pids=() i
+    local count=$(( ${#sources[@]} < mirror_hedge_count ? ${#sources[@]} : mirror_hedge_count ))
+    local race_dir
+    race_dir=$(mktemp -d)
+
+    for ((i = 0; i < count; i++)); do
+        curl -sfIL --max-time $mirror_probe_timeout -o /dev/null -w '%{time_starttransfer}' "$(mirror_url "${sources[$i]}" "$path")" > "$race_dir/$i" &
+        pids+=($!)
+    done
+
+    local winner=-1 running=("${pids[@]}") pid status finished_pid finished_status
+    while (( ${#running[@]} > 0 && winner < 0 )); do
+        mirror_wait_any "${running[@]}"
+        pid=$finished_pid status=$finished_status
+        [[ -z $pid ]] && break
+        for i in "${!running[@]}"; do
+            [[ ${running[$i]} == $pid ]] && unset 'running[i]'
+        done
+        for i in "${!pids[@]}"; do
+            [[ ${pids[$i]} == $pid ]] && break
+        done
+        if [[ $status == 0 ]]; then
+            winner=$i
+            mirror_record "${sources[$i]}" $(awk '{ printf "%d", $1 * 1000 }' "$race_dir/$i") - true
+        else
+            mirror_record "${sources[$i]}" - - false
+        fi
+    done
+    if (( ${#running[@]} > 0 )); then
+        kill "${running[@]}" 2> /dev/null
+        wait "${running[@]}" 2> /dev/null
+    fi
+    rm -rf "$race_dir"
+
+    (( winner >= 0 )) && echo "${sources[$winner]}"
+    for i in "${!sources[@]}"; do
+        (( i != winner )) && echo "${sources[$i]}"
+    done
+}
+
+# Usage: mirror_download <path> <destination> <sha256> <size> <sources...>
+# Downloads <path> from the best available source, moving down the ranking on failure or stalls
+function mirror_download {
+    local path=$1 destination=$2 sha256=$3 size=$4
+    shift 4
+    local ranked=() source
+    readarray -t ranked < <(mirror_rank "$@")
+    readarray -t ranked < <(mirror_race "$path" "${ranked[@]}")
+
+    for source in "${ranked[@]}"; do
+        echo "$0: downloading $(mirror_url "$source" "$path")"
+        local started have=0 file
+        started=$(mirror_now_ms)
+        for file in "$destination.part"*; do
+            have=$((have + $(download_file_size "$file")))
+        done
+
+        if download_gamedata "$(mirror_url "$source" "$path")" "$destination" "$sha256" "$size"; then
+            local elapsed=$(( $(mirror_now_ms) - started ))
+            local fetched=$(( $(download_file_size "$destination") - have ))
+            (( elapsed > 0 && fetched > 0 )) && mirror_record "$source" - $(( fetched * 1000 / elapsed )) true
+            return 0
+        fi
+
+        mirror_record "$source" - - false
+        echo "$0: failed to download from desired source"
+    done
+    return 1
+}
@@ -1,16 +1,30 @@
-from io import BytesIO
+import time
+STARTUP_STARTED = time.perf_counter()  # Taken before the other imports so startup timing includes them
+
+from collections import OrderedDict, deque
+from bisect import bisect_left
+from itertools import chain
 from threading import Thread
-from PyQt5 import QtWidgets, QtGui, QtCore, QtNetwork
-import requests
+from concurrent.futures import Future, ThreadPoolExecutor
+from PyQt5 import QtWidgets, QtGui, QtCore
 import os
 import urllib.parse
 import json
 import sys
-import hashlib
 import logging
 from appdirs import user_data_dir
-from PIL import Image
 import subprocess
+import queue
+import contextlib
+import sqlite3
+import threading
+import traceback
+import atexit
+import gc
+import re
+import unicodedata
+import glob
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 data_dir = user_data_dir("FlashGameManager", "aaron777collins")
 os.makedirs(data_dir, exist_ok=True)
@@ -18,7 +32,19 @@ data_folder = os.path.join(data_dir, 'data')
 log_folder = os.path.join(data_folder, 'FlashGameManager', 'log')
 if not os.path.exists(log_folder):
     os.makedirs(log_folder)
-logging.basicConfig(filename=os.path.join(log_folder, 'flash_game_manager.log'), level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Log records are queued by the calling thread and written by a background listener, so logging never blocks the UI
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+log_file_handler = RotatingFileHandler(os.path.join(log_folder, 'flash_game_manager.log'), maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
+log_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, log_file_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+log_queue_handler = QueueHandler(log_queue)
+log_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # The file handler adds the timestamp and level
+logging.basicConfig(level=logging.DEBUG, handlers=[log_queue_handler])
 
 # Color Variables
 BACKGROUND_COLOR = "#f0f0f0"
@@ -46,23 +72,132 @@ PAGE_SIZE = 15
 DEFAULT_STATUS_BAR_TIME = 3000
 INFINITE_SCROLL_THRESHOLD = 0.9
 
+# Thumbnail cache settings
+ICON_THUMBNAIL = "icon"
+SCREENSHOT_THUMBNAIL = "screenshot"
+THUMBNAIL_SIZES = {
+    ICON_THUMBNAIL: (ICON_IMAGE_WIDTH, ICON_IMAGE_HEIGHT),
+    SCREENSHOT_THUMBNAIL: (SCREENSHOT_IMAGE_WIDTH, SCREENSHOT_IMAGE_HEIGHT),
+}
+THUMBNAIL_MEMORY_BYTES = 48 * 1024 * 1024
+DECODE_THREADS = max(1, (os.cpu_count() or 2) - 1)  # Decodes allowed in flight at once
+
+# Image store settings
+IMAGE_SYNC_INTERVAL = 2  # Seconds between batched fsyncs of newly written images
+
+# Response cache settings (seconds / bytes)
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+CACHE_DEFAULT_TTL = 60 * 60
+CACHE_ENDPOINT_TTLS = {
+    "/search": 60 * 60,
+    "/addapps": 7 * 24 * 60 * 60,
+}
+CACHE_STALE_WHILE_REVALIDATE = 24 * 60 * 60  # How long past its TTL a stale entry may still be served
+CACHE_ACCESS_FLUSH_INTERVAL = 30  # Seconds that cache hits are batched before their access times are written
+
+# Remote endpoints; the environment overrides are for pointing the app at local stand-ins (see benchmark.py)
+DB_API_URL = os.environ.get("FLASH_GAME_MANAGER_DB_API_URL", "https://db-api.unstable.life")
+INFINITY_URL = os.environ.get("FLASH_GAME_MANAGER_INFINITY_URL", "https://infinity.unstable.life")
+
+# Shared HTTP client settings
+HTTP_TIMEOUT = (5, 30)  # (connect, read) seconds
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.5
+HTTP_MAX_CONNECTIONS_PER_HOST = 6
+HTTP_WORKERS = 16
+SEARCH_WORKERS = 2
+
+# Local catalog settings
+CATALOG_READERS = 4
+CATALOG_INDEX_BATCH = 5000
+
+# Type-ahead settings
+SUGGESTION_LIMIT = 10  # Titles shown under the search box
+SEARCH_AS_YOU_TYPE_DELAY = 300  # Milliseconds typing must pause before the results follow the search box
+SEARCH_SUPERSET_ENTRIES = 16  # Complete result sets kept for answering narrower queries locally
+SEARCH_SUPERSET_MAX_RESULTS = 2000  # Larger result sets are not kept
+
+# Facet settings
+FACET_FIELDS = ("platform", "library", "tags", "developer", "publisher")  # Indexed for every game list
+FACET_CHOICES = [("platform", "platforms"), ("tags", "tags"), ("developer", "developers")]  # (field, plural) offered as filters
+FACET_MAX_VALUES = 50  # Values listed per filter, most common first
+
+# Details view settings
+DETAILS_WORKERS = 2
+DETAILS_CACHE_ENTRIES = 256  # Additional-apps results kept in memory
+DETAILS_PREFETCH_DELAY = 250  # Milliseconds the list must rest before visible cards are prefetched
+
+# Background job queue settings
+JOB_WORKERS = 4
+JOB_MAX_ATTEMPTS = 3
+JOB_RETRY_BACKOFF = 2.0  # Seconds before the first retry of a failed step, doubled per attempt
+JOB_FAILED_EXPIRY = 7 * 24 * 60 * 60  # Seconds a failed job is kept for retrying before it is dropped
+ADD_GAME_JOB = "add_game"
+DOWNLOAD_GAMEDATA_JOB = "download_gamedata"
+JOB_STEPS = {
+    ADD_GAME_JOB: ["cache_logo", "cache_screenshot", "add_to_steam", "resolve_launch_plan"],
+    DOWNLOAD_GAMEDATA_JOB: ["download_gamedata"],
+}
+EXCLUSIVE_JOB_STEPS = {"add_to_steam"}  # SteamTinkerLaunch edits Steam's shortcuts file, so one at a time
+STEAM_SHORTCUTS_FILES = [  # Where Steam keeps non-Steam game shortcuts, for native and Flatpak installs
+    os.path.expanduser("~/.steam/steam/userdata/*/config/shortcuts.vdf"),
+    os.path.expanduser("~/.var/app/com.valvesoftware.Steam/.steam/steam/userdata/*/config/shortcuts.vdf"),
+]
+DOWNLOAD_WORKERS = 2  # Gamedata downloads run on their own queue so they never hold up adding games
+DOWNLOAD_PROGRESS_INTERVAL = 1000  # Milliseconds between reads of flashpoint-nano's download progress files
+DOWNLOAD_PROGRESS_STALE = 5  # Seconds after which an unchanged progress file is treated as abandoned
+DATABASE_SYNC_INTERVAL = 24 * 60 * 60  # Seconds between checks for a newer catalog database
+
+# Tracing settings
+TRACE_MAX_EVENTS = 50000  # Spans kept in memory for export; the oldest are dropped first
+WATCHDOG_HEARTBEAT = 50  # Milliseconds between event loop heartbeats
+STALL_THRESHOLD = 250  # Milliseconds without a heartbeat before the event loop counts as blocked
+
+# Memory settings
+MEMORY_CHECK_INTERVAL = 30 * 1000  # Milliseconds between memory checks
+MEMORY_BUDGET_BYTES = 512 * 1024 * 1024  # Resident size above which caches are trimmed
+MEMORY_TRIM_FRACTION = 4  # Caches keep 1/N of their contents when trimmed
+
+# Startup settings
+STARTUP_HISTORY_ENTRIES = 50  # Startup timings kept in startup_times.json
+STARTUP_BUDGET_MS = 1500  # Time-to-interactive above this is logged as a regression
+
 
 class FlashGameManager(QtWidgets.QMainWindow):
-    def __init__(self):
+    additional_apps_fetched = QtCore.pyqtSignal(str, object)  # (game id, Future of the apps list)
+    screenshot_downloaded = QtCore.pyqtSignal(str, object)  # (game id, Future of the saved path)
+    database_synced = QtCore.pyqtSignal(str)  # flashpoint-nano's sync result, or "failed"
+
+    def __init__(self, startup_profiler=None):
         super().__init__()
         logging.info("Initializing FlashGameManager")
+        self.startup_profiler = startup_profiler or StartupProfiler(STARTUP_STARTED)
         self.setWindowTitle("Flash Game Manager")
         self.setGeometry(100, 100, 1000, 700)
         self.setStyleSheet(f"background-color: {BACKGROUND_COLOR};")
-        self.games_data = []
-        self.my_games = []
+        self.my_games = None
         self.current_game = None
         self.data_folder = os.path.join(data_folder, 'FlashGameManager', 'game_data')
         self.steam_tinker_launch_exec = os.path.join(self.data_folder, 'SteamTinkerLaunch', 'steamtinkerlaunch')
         self.images_folder = os.path.join(self.data_folder, 'images')
         self.cache_folder = os.path.join(self.data_folder, 'cache')
-        self.my_games_file = os.path.join(self.data_folder, 'my_games.json')
-        self.game_image_layouts_dict: dict[str, QtWidgets.QLayout] = {}
+        self.flashpoint_dir = os.path.join(self.data_folder, 'flashpoint-nano')
+        self.my_games_file = os.path.join(self.data_folder, 'my_games.sqlite')
+        self.legacy_my_games_file = os.path.join(self.data_folder, 'my_games.json')
+        self.failed_icons: set[str] = set()
+        self.image_downloaders: dict[str, ImageDownloader] = {}
+        self.revalidating_urls = set()
+        self.revalidating_lock = threading.Lock()
+        self.search_executor = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix='search')
+        self.search_pager = SearchPager(self.fetch_search_page, self.search_executor)
+        self.search_pager.page_ready.connect(self.display_games_for_search_page)
+        self.search_pager.search_failed.connect(self.on_search_failed)
+        self.details_executor = ThreadPoolExecutor(max_workers=DETAILS_WORKERS, thread_name_prefix='details')
+        self.additional_apps_cache: OrderedDict[str, list] = OrderedDict()
+        self.pending_additional_apps: set[str] = set()
+        self.pending_screenshots: set[str] = set()
+        self.additional_apps_fetched.connect(self.on_additional_apps_fetched)
+        self.screenshot_downloaded.connect(self.on_screenshot_downloaded)
 
         if not os.path.exists(self.data_folder):
             os.makedirs(self.data_folder)
@@ -70,20 +205,159 @@ class FlashGameManager(QtWidgets.QMainWindow):
         if not os.path.exists(self.cache_folder):
             os.makedirs(self.cache_folder)
             logging.info(f"Created cache folder: {self.cache_folder}")
+        self.http_client = HttpClient()
+        self.game_images = ImageStore(os.path.join(self.data_folder, 'game_images'))
+        self.thumbnails = ThumbnailCache(os.path.join(self.data_folder, 'thumbnails'))
+        self.thumbnails.thumbnail_ready.connect(self.on_thumbnail_ready)
+        self.thumbnails.thumbnail_discarded.connect(self.on_thumbnail_discarded)
+        self.response_cache = ResponseCache(self.cache_folder)
+        self.catalog = Catalog(
+            os.path.join(self.flashpoint_dir, 'database', 'flashpoint.sqlite'),
+            os.path.join(self.cache_folder, 'catalog_index.sqlite')
+        )
+        self.catalog.refresh_in_background()
+
+        # Suggestions draw on the catalog and on earlier search results; My Games adds its titles once loaded
+        self.title_index = TitleIndex()
+        self.title_index.add_from(self.cached_search_titles)
+        if self.catalog.is_available():
+            self.title_index.add_from(self.catalog.titles)
+        self.sync_database_in_background()
 
         self.window_icon_path = os.path.join(self.images_folder, 'icon_128x128.png')
         logging.info(f"Loading window icon from {self.window_icon_path}")
         icon = QtGui.QIcon()
         icon.addPixmap(QtGui.QPixmap(self.window_icon_path), QtGui.QIcon.Selected, QtGui.QIcon.On)
         self.setWindowIcon(icon)
-        self.load_my_games()
+        self.startup_profiler.mark("services")
         self.init_ui()
+        self.startup_profiler.mark("search_view")
         self.status_bar = QtWidgets.QStatusBar()
         self.status_bar.setStyleSheet("background-color: none;")
         self.setStatusBar(self.status_bar)
+        self.jobs_label = QtWidgets.QLabel()
+        self.status_bar.addPermanentWidget(self.jobs_label)
+        # Failed jobs wait here until they are retried or dismissed, or expire after JOB_FAILED_EXPIRY
+        self.retry_jobs_button = QtWidgets.QPushButton("Retry")
+        self.retry_jobs_button.clicked.connect(self.retry_failed_jobs)
+        self.status_bar.addPermanentWidget(self.retry_jobs_button)
+        self.dismiss_jobs_button = QtWidgets.QPushButton("Dismiss")
+        self.dismiss_jobs_button.clicked.connect(self.dismiss_failed_jobs)
+        self.status_bar.addPermanentWidget(self.dismiss_jobs_button)
+
+        # Background jobs; anything left over from the last run resumes now
+        self.job_queue = JobQueue(os.path.join(self.data_folder, 'jobs.sqlite'))
+        self.job_queue.register_step("cache_logo", self.cache_logo_step)
+        self.job_queue.register_step("cache_screenshot", self.cache_screenshot_step)
+        self.job_queue.register_step("add_to_steam", self.add_to_steam_step)
+        self.job_queue.register_step("resolve_launch_plan", self.resolve_launch_plan_step)
+        self.job_queue.job_progress.connect(self.on_job_progress)
+        self.job_queue.job_finished.connect(self.on_job_finished)
+        self.download_queue = JobQueue(os.path.join(self.data_folder, 'downloads.sqlite'), workers=DOWNLOAD_WORKERS)
+        self.download_queue.register_step("download_gamedata", self.download_gamedata_step)
+        self.download_queue.job_progress.connect(self.on_download_progress)
+        self.download_queue.job_finished.connect(self.on_download_finished)
+        self.download_progress_timer = QtCore.QTimer(self)
+        self.download_progress_timer.setInterval(DOWNLOAD_PROGRESS_INTERVAL)
+        self.download_progress_timer.timeout.connect(self.update_jobs_label)
+        self.job_queue.resume()
+        self.download_queue.resume()
+        self.update_jobs_label()
+
+        # Speculatively load details for the cards on screen once scrolling settles
+        self.prefetch_timer = QtCore.QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(DETAILS_PREFETCH_DELAY)
+        self.prefetch_timer.timeout.connect(self.prefetch_visible_details)
+        self.watch_for_prefetch(self.results_view)
+        self.tabs.currentChanged.connect(self.prefetch_timer.start)
+        self.startup_profiler.mark("jobs")
+
+        # Ctrl+Shift+T saves the recent spans as a Chrome trace
+        self.traces_folder = os.path.join(self.data_folder, 'traces')
+        self.watchdog = None
+        self.memory_monitor = None
+        QtWidgets.QShortcut(QtGui.QKeySequence("Ctrl+Shift+T"), self, activated=self.export_trace)
+
+        # My Games is loaded once the window is on screen rather than before it
+        QtCore.QTimer.singleShot(0, self.finish_startup)
+
+    def finish_startup(self):
+        self.startup_profiler.mark("first_paint")
+        self.ensure_my_games()
+        self.startup_profiler.mark("my_games")
+        self.startup_profiler.finish(os.path.join(self.data_folder, 'startup_times.json'))
+        # Watch the event loop only from here on; startup itself is timed above
+        self.watchdog = StallWatchdog(self)
+        self.memory_monitor = MemoryMonitor(self.memory_report, self.trim_memory, parent=self)
+        keep = frozenset(game['id'] for game in self.my_games.games())
+        Thread(target=self.migrate_images, args=(keep,), name='image-migration', daemon=True).start()
+
+    def migrate_images(self, keep: frozenset):
+        # Older versions kept every image loose in the data folder; a no-op scan once they are moved
+        with tracer.span("migrate_images", "disk"):
+            migrated = self.game_images.migrate(self.data_folder, keep) + self.thumbnails.migrate()
+        if migrated:
+            logging.info(f"Moved {migrated} images into the sharded image store")
+
+    def memory_report(self) -> dict:
+        return {
+            'image_downloaders': len(self.image_downloaders),
+            'thumbnails': len(self.thumbnails.pixmaps),
+            'thumbnail_mb': self.thumbnails.total_bytes // (1024 * 1024),
+            'pending_thumbnails': len(self.thumbnails.pending),
+            'additional_apps': len(self.additional_apps_cache),
+            'search_results': self.results_model.rowCount(),
+            'my_games': self.my_games_model.rowCount(),
+            'suggestion_titles': len(self.title_index),
+            'search_supersets': len(self.search_pager.supersets),
+            'failed_icons': len(self.failed_icons),
+        }
+
+    def trim_memory(self):
+        # Everything dropped here is decoded, fetched or computed again when it is next needed
+        self.thumbnails.trim(self.thumbnails.max_bytes // MEMORY_TRIM_FRACTION)
+        while len(self.additional_apps_cache) > DETAILS_CACHE_ENTRIES // MEMORY_TRIM_FRACTION:
+            self.additional_apps_cache.popitem(last=False)
+        self.search_pager.supersets.clear()
+        self.failed_icons.clear()
+        QtGui.QPixmapCache.clear()
+
+    def export_trace(self):
+        path = os.path.join(self.traces_folder, f"trace_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        try:
+            count = tracer.export(path)
+        except OSError as e:
+            logging.error(f"Failed to export trace: {e}")
+            self.set_status_error("Failed to export trace.", DEFAULT_STATUS_BAR_TIME)
+            return
+        logging.info(f"Exported {count} trace events to {path}")
+        self.set_status_success(f"Trace saved to {path}", DEFAULT_STATUS_BAR_TIME)
+
+    def closeEvent(self, event):
+        # Keep the spans of the last session around for later inspection
+        if self.watchdog is not None:
+            self.watchdog.stop()
+            self.memory_monitor.stop()
+        self.game_images.sync()
+        self.response_cache.close()
+        try:
+            tracer.export(os.path.join(self.traces_folder, 'last_session.json'))
+        except OSError as e:
+            logging.error(f"Failed to export trace: {e}")
+        super().closeEvent(event)
+
+    def watch_for_prefetch(self, view: QtWidgets.QListView):
+        view.verticalScrollBar().valueChanged.connect(self.prefetch_timer.start)
+        view.model().rowsInserted.connect(self.prefetch_timer.start)
+        view.model().modelReset.connect(self.prefetch_timer.start)
 
     def init_ui(self):
         logging.info("Initializing UI")
+        # One delegate paints the game cards of every list
+        self.game_card_delegate = GameCardDelegate(self)
+        self.game_card_delegate.action_triggered.connect(self.on_game_card_action)
+
         self.central_widget = QtWidgets.QWidget()
         self.setCentralWidget(self.central_widget)
         self.layout = QtWidgets.QVBoxLayout(self.central_widget)
@@ -92,20 +366,42 @@ class FlashGameManager(QtWidgets.QMainWindow):
         self.tabs = QtWidgets.QTabWidget()
         self.layout.addWidget(self.tabs)
 
+        # The My Games model exists from the start so adds and removes always have somewhere to go
+        self.my_games_model = GameListModel(self.request_game_icon, self.is_in_my_games)
+
         # Search View
         self.search_tab = QtWidgets.QWidget()
         self.tabs.addTab(self.search_tab, "Search Games")
-        self.create_search_view()
+        with tracer.span("build_search_view", "widgets"):
+            self.create_search_view()
 
-        # My Games View
+        # My Games and Details views are only built the first time they are shown
         self.my_games_tab = QtWidgets.QWidget()
         self.tabs.addTab(self.my_games_tab, "My Games")
-        self.create_my_games_view()
-
-        # Details View
         self.details_tab = QtWidgets.QWidget()
         self.tabs.addTab(self.details_tab, "Game Details")
-        self.create_details_view()
+        self.my_games_view = None
+        self.details_text = None
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+
+    def on_tab_changed(self, index: int):
+        widget = self.tabs.widget(index)
+        if widget is self.my_games_tab:
+            self.ensure_my_games_view()
+        elif widget is self.details_tab:
+            self.ensure_details_view()
+
+    def ensure_my_games_view(self):
+        if self.my_games_view is None:
+            with tracer.span("build_my_games_view", "widgets"):
+                self.ensure_my_games()
+                self.create_my_games_view()
+                self.watch_for_prefetch(self.my_games_view)
+
+    def ensure_details_view(self):
+        if self.details_text is None:
+            with tracer.span("build_details_view", "widgets"):
+                self.create_details_view()
 
     def create_search_view(self):
         logging.info("Creating search view")
@@ -117,25 +413,75 @@ class FlashGameManager(QtWidgets.QMainWindow):
         self.search_input.setPlaceholderText("Search for a game...")
         self.search_input.setStyleSheet("padding: 8px; font-size: 14px;")
         self.search_input.returnPressed.connect(self.search_game)
+        self.search_input.textEdited.connect(self.on_search_text_edited)
         search_button = QtWidgets.QPushButton("Search")
         search_button.setStyleSheet(f"background-color: {BUTTON_COLOR}; color: {BUTTON_TEXT_COLOR}; padding: 8px; font-size: 14px; border-radius: 4px;")
         search_button.clicked.connect(self.search_game)
 
+        # The catalog database is large, so the first download waits until it is asked for; until then searches use the API
+        self.download_catalog_button = QtWidgets.QPushButton("Download Catalog")
+        self.download_catalog_button.setToolTip("Download the Flashpoint database (several hundred MB) for faster searches that work offline")
+        self.download_catalog_button.setStyleSheet(f"background-color: {BUTTON_COLOR}; color: {BUTTON_TEXT_COLOR}; padding: 8px; font-size: 14px; border-radius: 4px;")
+        self.download_catalog_button.clicked.connect(self.download_catalog)
+        self.download_catalog_button.setVisible(not self.catalog.is_available())
+        self.database_synced.connect(self.on_database_synced)
+
         search_bar_layout.addWidget(self.search_input)
         search_bar_layout.addWidget(search_button)
+        search_bar_layout.addWidget(self.download_catalog_button)
         search_layout.addLayout(search_bar_layout)
 
-        # Search results area with scroll
-        self.results_area = QtWidgets.QScrollArea()
-        self.results_area.setWidgetResizable(True)
-        self.results_area.setStyleSheet("QScrollBar:vertical { width: 8px; background: #f0f0f0; } QScrollBar::handle:vertical { background: #888888; border-radius: 4px; } QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }")
-        self.results_widget = QtWidgets.QWidget()
-        self.results_layout = QtWidgets.QVBoxLayout(self.results_widget)
-        self.results_layout.setAlignment(QtCore.Qt.AlignTop)
-        self.results_area.setWidget(self.results_widget)
-        self.results_area.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
-
-        search_layout.addWidget(self.results_area)
+        # Suggestions follow every keystroke; the results follow once typing pauses
+        self.suggestions_model = QtCore.QStringListModel(self)
+        self.search_completer = QtWidgets.QCompleter(self.suggestions_model, self)
+        self.search_completer.setCompletionMode(QtWidgets.QCompleter.UnfilteredPopupCompletion)
+        self.search_completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.search_completer.activated[str].connect(self.on_suggestion_activated)
+        self.search_input.setCompleter(self.search_completer)
+        self.search_debounce = QtCore.QTimer(self)
+        self.search_debounce.setSingleShot(True)
+        self.search_debounce.setInterval(SEARCH_AS_YOU_TYPE_DELAY)
+        self.search_debounce.timeout.connect(self.search_as_you_type)
+
+        # Busy indicator shown while a search is in flight
+        self.search_progress = QtWidgets.QProgressBar()
+        self.search_progress.setRange(0, 0)
+        self.search_progress.setTextVisible(False)
+        self.search_progress.setFixedHeight(4)
+        self.search_progress.hide()
+        search_layout.addWidget(self.search_progress)
+
+        # Search results list; only the visible rows are ever painted, and the facets hide the rest
+        self.results_model = GameListModel(self.request_game_icon, self.is_in_my_games)
+        for model in (self.results_model, self.my_games_model):
+            model.modelReset.connect(self.cancel_unlisted_downloads)
+            model.rowsRemoved.connect(self.cancel_unlisted_downloads)
+        self.results_proxy = FacetFilterProxyModel(self.results_model)
+        self.results_facets = FacetBar(self.results_proxy)
+        search_layout.addWidget(self.results_facets)
+        self.results_view = self.create_game_list_view(self.results_proxy)
+        self.results_view.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
+
+        search_layout.addWidget(self.results_view)
+
+        # Infinite scroll: connected exactly once, here
+        self.results_view.verticalScrollBar().valueChanged.connect(self.handle_scroll)
+        self.results_view.verticalScrollBar().rangeChanged.connect(self.handle_scroll_range)
+
+    def create_game_list_view(self, model: QtCore.QAbstractItemModel) -> QtWidgets.QListView:
+        view = QtWidgets.QListView()
+        view.setModel(model)
+        view.setItemDelegate(self.game_card_delegate)
+        view.setUniformItemSizes(True)
+        view.setSpacing(4)
+        view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        view.verticalScrollBar().setSingleStep(20)
+        view.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        view.setFocusPolicy(QtCore.Qt.NoFocus)
+        view.setFrameShape(QtWidgets.QFrame.NoFrame)
+        view.setStyleSheet("QScrollBar:vertical { width: 8px; background: #f0f0f0; } QScrollBar::handle:vertical { background: #888888; border-radius: 4px; } QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }")
+        return view
 
     def create_my_games_view(self):
         logging.info("Creating My Games view")
@@ -147,6 +493,7 @@ class FlashGameManager(QtWidgets.QMainWindow):
         self.filter_input.setPlaceholderText("Filter games...")
         self.filter_input.setStyleSheet("padding: 8px; font-size: 14px;")
         self.filter_input.returnPressed.connect(self.update_my_games_view)
+        self.filter_input.textChanged.connect(self.update_my_games_view)
         filter_button = QtWidgets.QPushButton("Filter")
         filter_button.setStyleSheet(f"background-color: {BUTTON_COLOR}; color: {BUTTON_TEXT_COLOR}; padding: 8px; font-size: 14px; border-radius: 4px;")
         filter_button.clicked.connect(self.update_my_games_view)
@@ -155,16 +502,13 @@ class FlashGameManager(QtWidgets.QMainWindow):
         filter_bar_layout.addWidget(filter_button)
         my_games_layout.addLayout(filter_bar_layout)
 
-        # My games area with scroll
-        self.my_games_area = QtWidgets.QScrollArea()
-        self.my_games_area.setWidgetResizable(True)
-        self.my_games_area.setStyleSheet("QScrollBar:vertical { width: 8px; background: #f0f0f0; } QScrollBar::handle:vertical { background: #888888; border-radius: 4px; } QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }")
-        self.my_games_widget = QtWidgets.QWidget()
-        self.my_games_layout = QtWidgets.QVBoxLayout(self.my_games_widget)
-        self.my_games_layout.setAlignment(QtCore.Qt.AlignTop)
-        self.my_games_area.setWidget(self.my_games_widget)
+        # My games list; the model always holds the whole collection and the proxy hides filtered rows
+        self.my_games_proxy = FacetFilterProxyModel(self.my_games_model)
+        self.my_games_facets = FacetBar(self.my_games_proxy)
+        my_games_layout.addWidget(self.my_games_facets)
+        self.my_games_view = self.create_game_list_view(self.my_games_proxy)
 
-        my_games_layout.addWidget(self.my_games_area)
+        my_games_layout.addWidget(self.my_games_view)
         self.update_my_games_view()
 
     def create_details_view(self):
@@ -179,6 +523,18 @@ class FlashGameManager(QtWidgets.QMainWindow):
         self.image_frame.setStyleSheet("padding: 20px;")
         self.details_layout.addWidget(self.image_frame)
 
+        # Logo and screenshot labels are reused for every game
+        self.details_logo_label = QtWidgets.QLabel()
+        self.details_logo_label.setFixedSize(ICON_IMAGE_WIDTH, ICON_IMAGE_HEIGHT)
+        self.details_logo_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.details_logo_label.setStyleSheet(f"border: 1px solid {BORDER_COLOR}; border-radius: 8px;")
+        self.image_layout.addWidget(self.details_logo_label)
+        self.details_screenshot_label = QtWidgets.QLabel()
+        self.details_screenshot_label.setFixedSize(SCREENSHOT_IMAGE_WIDTH, SCREENSHOT_IMAGE_HEIGHT)
+        self.details_screenshot_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.details_screenshot_label.setStyleSheet(f"border: 1px solid {BORDER_COLOR}; border-radius: 8px;")
+        self.image_layout.addWidget(self.details_screenshot_label)
+
         # Game details area
         self.details_text = QtWidgets.QTextEdit()
         self.details_text.setReadOnly(True)
@@ -216,28 +572,94 @@ class FlashGameManager(QtWidgets.QMainWindow):
 
     def cache_request(self, url):
         logging.info(f"Cache request for URL: {url}")
-        # Create a hash of the URL to use as the cache filename
-        cache_key = hashlib.md5(url.encode()).hexdigest()
-        cache_path = os.path.join(self.cache_folder, f"{cache_key}.json")
-
-        # Check if the response is already cached
-        if os.path.exists(cache_path):
-            logging.info(f"Loading cached response for URL: {url}")
-            with open(cache_path, 'r') as cache_file:
-                return json.load(cache_file)
-
-        # If not cached, make the request and cache the response
-        response = requests.get(url)
+        with tracer.span("cache_lookup", "cache", url=url):
+            entry = self.response_cache.lookup(url)
+
+        if entry is not None:
+            if entry['age'] < entry['ttl']:
+                logging.info(f"Loading cached response for URL: {url}")
+                return entry['data']
+            if entry['age'] < entry['ttl'] + CACHE_STALE_WHILE_REVALIDATE:
+                # Serve the stale copy right away and refresh it in the background
+                logging.info(f"Serving stale response for URL: {url} while revalidating")
+                self.revalidate_in_background(url, entry)
+                return entry['data']
+
+        # Missing or expired, so fetch (conditionally, when we have validators) and cache it
+        data = self.fetch_and_cache(url, entry)
+        if data is None and entry is not None:
+            logging.warning(f"Falling back to expired cached response for URL: {url}")
+            return entry['data']
+        return data
+
+    def fetch_and_cache(self, url, entry=None):
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        import requests
+        try:
+            response = self.http_client.get(url, headers=headers)
+        except requests.RequestException as e:
+            logging.error(f"Failed to fetch data from URL: {url} - {e}")
+            return None
+
+        if response.status_code == 304 and entry is not None:
+            logging.info(f"Cached response for URL: {url} is still valid")
+            self.response_cache.mark_revalidated(url)
+            return entry['data']
         if response.status_code == 200:
+            try:
+                data = response.json()
+            except ValueError as e:
+                logging.error(f"Invalid JSON from URL: {url} - {e}")
+                return None
             logging.info(f"Caching response for URL: {url}")
-            with open(cache_path, 'w') as cache_file:
-                json.dump(response.json(), cache_file)
-            return response.json()
-        else:
-            logging.error(f"Failed to fetch data from URL: {url} with status code {response.status_code}")
-            return None
+            self.response_cache.store(url, response.content, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            return data
+
+        logging.error(f"Failed to fetch data from URL: {url} with status code {response.status_code}")
+        return None
+
+    def revalidate_in_background(self, url, entry):
+        with self.revalidating_lock:
+            if url in self.revalidating_urls:
+                return
+            self.revalidating_urls.add(url)
+
+        def revalidate():
+            try:
+                self.fetch_and_cache(url, entry)
+            finally:
+                with self.revalidating_lock:
+                    self.revalidating_urls.discard(url)
+
+        Thread(target=revalidate, daemon=True).start()
+
+    def on_search_text_edited(self, text: str):
+        with tracer.span("suggest", "search"):
+            self.suggestions_model.setStringList(self.title_index.suggest(text))
+        self.search_debounce.start()
+
+    def search_as_you_type(self):
+        query = self.search_input.text().strip()
+        if query and query != self.search_pager.query:
+            self.search_game()
+
+    def on_suggestion_activated(self, title: str):
+        # Enter on a suggestion also reaches returnPressed, which would search the same title again
+        if title.strip() != self.search_pager.query:
+            self.search_game()
+
+    def cached_search_titles(self) -> list:
+        # Runs on the title index thread
+        return [game.get('title') for games in self.response_cache.cached_data('/search') if isinstance(games, list) for game in games if isinstance(game, dict)]
 
     def search_game(self):
+        self.search_debounce.stop()
         query = self.search_input.text().strip()
         logging.info(f"Searching for game with query: {query}")
         if not query:
@@ -245,211 +667,161 @@ class FlashGameManager(QtWidgets.QMainWindow):
             self.set_status_warning("Search input is empty.", DEFAULT_STATUS_BAR_TIME)
             return
 
-        encoded_query = urllib.parse.quote(query)
-        search_url = f"https://db-api.unstable.life/search?smartSearch={encoded_query}&filter=true&fields=id,title,developer,publisher,platform,library,tags,originalDescription,dateAdded,dateModified"
-        self.games_data = self.cache_request(search_url)
+        # A newer query supersedes whatever is still in flight
+        self.search_progress.show()
+        self.status_bar.setStyleSheet("")
+        self.status_bar.showMessage(f"Searching for \"{query}\"...")
+        self.search_pager.start(query)
 
-        if self.games_data is not None:
-            if len(self.games_data) == 1:
-                self.games_data.append({"id": "fake_entry", "title": "", "originalDescription": ""})  # Adding a placeholder to avoid the single entry issue
-            self.display_search_results()
-        else:
-            logging.error("Failed to fetch search results")
-            self.set_status_error("Failed to fetch search results.", DEFAULT_STATUS_BAR_TIME)
+    def fetch_search_page(self, query: str, page_number: int):
+        # Runs on a search worker thread; the local catalog answers first, the remote API is the fallback
+        with tracer.span("search_page", "search", query=query, page=page_number):
+            if self.catalog.is_ready():
+                try:
+                    return self.catalog.search(query, PAGE_SIZE, (page_number - 1) * PAGE_SIZE)
+                except sqlite3.Error as e:
+                    logging.error(f"Local catalog search failed, falling back to the API: {e}")
+
+            encoded_query = urllib.parse.quote(query)
+            offset = (page_number - 1) * PAGE_SIZE
+            search_url = f"{DB_API_URL}/search?smartSearch={encoded_query}&filter=true&fields=id,title,developer,publisher,platform,library,tags,originalDescription,dateAdded,dateModified&limit={PAGE_SIZE}&offset={offset}"
+            return self.cache_request(search_url)
+
+    @QtCore.pyqtSlot(str)
+    def on_search_failed(self, query: str):
+        self.search_progress.hide()
+        logging.error(f"Failed to fetch search results for query: {query}")
+        self.set_status_error("Failed to fetch search results.", DEFAULT_STATUS_BAR_TIME)
 
     def display_search_results(self):
         logging.info("Displaying search results (initial)")
 
         # Clear previous search results
-        for i in reversed(range(self.results_layout.count())):
-            widget = self.results_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.deleteLater()
-
-        # Define variables for pagination
-        self.current_page = 1
-        self.all_games_loaded = False  # Flag to track if all games are displayed
-
-        # Display initial set of games (modify this to fetch data for page 1)
-        self.display_games_for_search_page(self.current_page)
-
-        # Connect scroll event handler
-        self.results_area.verticalScrollBar().valueChanged.connect(self.handle_scroll)
+        self.results_model.clear()
+        self.results_view.scrollToTop()
 
     def handle_scroll(self, value):
         # Check if scroll is near the bottom
-        scroll_bar = self.results_area.verticalScrollBar()
-        max_value = scroll_bar.maximum()
-        threshold = INFINITE_SCROLL_THRESHOLD  # Adjust this value to define "near bottom"
-
-        if (max_value == 0):
-            self.display_games_for_search_page(0)
-            return
-
-        if (value / max_value) >= threshold and not self.all_games_loaded:
-            self.display_games_for_search_page(self.current_page + 1)
-
-    def display_games_for_search_page(self, page_number):
-        logging.info(f"Getting search results for page {page_number}")
-        # Fetch data for the given page
-        fetched_games = self.get_games_by_page(page_number)
-
-        if not fetched_games:
-            self.all_games_loaded = True
-            return
-
-        self.current_page += 1
-
-        # Display each game in fetched data
-        for game in fetched_games:
-            game_frame = QtWidgets.QFrame()
-            game_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-            game_frame.setStyleSheet(f"background-color: {WIDGET_BACKGROUND_COLOR}; border: 1px solid {BORDER_COLOR}; padding: 10px; border-radius: 8px;")
-            game_layout = QtWidgets.QHBoxLayout(game_frame)
-
-            image_layout = QtWidgets.QVBoxLayout()
-
-            # Fetch and display image
-            game_id = game['id']
-            if game_id == "fake_entry":
-                continue
-
-            img_label = self.load_icon_from_url_and_get_img_label(game_id)
-
-            image_layout.addWidget(img_label)
-            self.game_image_layouts_dict[game_id] = image_layout
-            self.addPlatformTagToLayout(game, image_layout)
-            game_layout.addLayout(image_layout)
-
-            # Game info
-            info_layout = QtWidgets.QVBoxLayout()
-
-            self.addTitleLayout(game, info_layout)
-            self.addDescription(game, info_layout)
-
-            # Buttons
-            details_button = QtWidgets.QPushButton("Details")
-            details_button.setStyleSheet(f"background-color: {DETAILS_BUTTON_COLOR}; color: {BUTTON_TEXT_COLOR}; padding: 8px; font-size: 14px; border-radius: 4px;")
-            details_button.clicked.connect(lambda checked, g=game: self.show_game_details(g))
-            bottom_buttons = []
-            bottom_buttons.append(details_button)
-
-            if game in self.my_games:
-                remove_button = QtWidgets.QPushButton("Remove")
-                remove_button.setStyleSheet(f"background-color: {REMOVE_BUTTON_COLOR}; color: {BUTTON_TEXT_COLOR}; padding: 8px; font-size: 14px; border-radius: 4px;")
-                remove_button.clicked.connect(lambda checked, g=game: self.remove_from_my_games(g))
-                bottom_buttons.append(remove_button)
-            else:
-                add_button = QtWidgets.QPushButton("Add to My Games")
-                add_button.setStyleSheet(f"background-color: {BUTTON_COLOR}; color: {BUTTON_TEXT_COLOR}; padding: 8px; font-size: 14px; border-radius: 4px;")
-                add_button.clicked.connect(lambda checked, g=game: self.add_to_my_games(g))
-                bottom_buttons.append(add_button)
-
-            self.add_bottom_aligned_buttons(info_layout, bottom_buttons, QtCore.Qt.AlignRight)
-
-
-            game_layout.addLayout(info_layout)
-            # Calculate the new scroll position to maintain visibility
-            new_scroll_pos = self.results_layout.count() * game_frame.height() - self.results_area.height()
+        max_value = self.results_view.verticalScrollBar().maximum()
+        if max_value > 0 and (value / max_value) >= INFINITE_SCROLL_THRESHOLD:
+            self.search_pager.show_next()
+
+    def handle_scroll_range(self, min_value, max_value):
+        # Keep appending pages while the results do not fill the view yet
+        if max_value == 0 and self.search_pager.shown_pages > 0:
+            self.search_pager.show_next()
+
+    @QtCore.pyqtSlot(int, list)
+    def display_games_for_search_page(self, page_number, games):
+        logging.info(f"Displaying search results for page {page_number}")
+        if page_number == 1:
+            self.search_progress.hide()
+            self.status_bar.clearMessage()
+            self.display_search_results()
 
-            # Set the scroll position smoothly (optional)
-            animation = QtCore.QPropertyAnimation(self.results_area.verticalScrollBar(), b"value")
-            animation.setDuration(100)
-            animation.setStartValue(self.results_area.verticalScrollBar().value())
-            animation.setEndValue(new_scroll_pos)
-            animation.start()
-            self.results_layout.addWidget(game_frame)
+        # Append the page to the model; the view only paints the rows that are visible
+        self.results_model.append_games(games)
+        self.title_index.add(game.get('title') for game in games)
 
         logging.info(f"Displayed search results for page {page_number}")
         self.set_status_success(f"Displayed search results for page {page_number}", DEFAULT_STATUS_BAR_TIME)
 
-    def get_games_by_page(self, page_number: int) -> list:
-        page_index = page_number-1
-        start_num = page_index * PAGE_SIZE
-        end_num = (page_index+1) * PAGE_SIZE
-        return self.games_data[start_num:end_num]
-
-    def load_icon_from_url_and_get_img_label(self, game_id) -> QtWidgets.QLabel:
-        img_url = f"https://infinity.unstable.life/images/Logos/{game_id[:2]}/{game_id[2:4]}/{game_id}.png?type=png"
-        img_path = os.path.join(self.data_folder, f"{game_id}.png")
-
-        # Placeholder label while the image loads
-        placeholder_label = QtWidgets.QLabel("Loading...")
-        placeholder_label.setFixedSize(ICON_IMAGE_WIDTH, ICON_IMAGE_HEIGHT)
-        placeholder_label.setSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
-
-        # Start asynchronous image loading with ImageDownloader
-        downloader = ImageDownloader(game_id, img_url, img_path)
-        downloader.image_loaded.connect(self.update_image_layout)
-
-        # Optionally store downloader instance to keep a reference if needed
-        setattr(self, f"downloader_{game_id}", downloader)
+    def request_game_icon(self, game_id: str):
+        """
+        Return the icon pixmap for a game, or None while it is still being fetched.
 
-        return placeholder_label
+        Icons are only requested when a card is painted, so only visible games hit the disk or network.
+        A null pixmap means the icon could not be loaded.
+        """
+        pixmap = self.thumbnails.get(ICON_THUMBNAIL, game_id)
+        if pixmap is not None:
+            return pixmap
+        if game_id in self.failed_icons:
+            return QtGui.QPixmap()
+        if self.thumbnails.request(ICON_THUMBNAIL, game_id, self.game_images.path(game_id)):
+            return None
 
-    @QtCore.pyqtSlot(str, QtWidgets.QLabel)
-    def update_image_layout(self, game_id, img_label):
-        if game_id in self.game_image_layouts_dict:
-            layout = self.game_image_layouts_dict[game_id]
-            old_widget = layout.itemAt(0).widget()
-            layout.replaceWidget(old_widget, img_label)
-            old_widget.deleteLater()
+        if game_id not in self.image_downloaders:
+            img_url = f"{INFINITY_URL}/images/Logos/{game_id[:2]}/{game_id[2:4]}/{game_id}.png?type=png"
+            downloader = ImageDownloader(game_id, img_url, self.game_images, self.http_client, self.thumbnails)
+            downloader.image_failed.connect(lambda failed_id: self.update_game_icon(failed_id, QtGui.QPixmap()))
+            downloader.finished.connect(self.release_image_downloader)
+            self.image_downloaders[game_id] = downloader  # Keep reference until it finishes
+        return None
+
+    @QtCore.pyqtSlot(str)
+    def release_image_downloader(self, game_id: str):
+        downloader = self.image_downloaders.pop(game_id, None)
+        if downloader is not None:
+            downloader.deleteLater()
+
+    def cancel_unlisted_downloads(self):
+        # Icons for games that are no longer in either list are not worth fetching any more
+        for game_id, downloader in list(self.image_downloaders.items()):
+            if game_id not in self.results_model.rows_by_id and game_id not in self.my_games_model.rows_by_id:
+                downloader.cancel()
+
+    @QtCore.pyqtSlot(str, QtGui.QPixmap)
+    def update_game_icon(self, game_id, pixmap):
+        if pixmap.isNull():
+            self.failed_icons.add(game_id)
+        self.results_model.refresh_game(game_id)
+        self.my_games_model.refresh_game(game_id)
+
+    def is_in_my_games(self, game) -> bool:
+        return self.ensure_my_games().contains(game['id'])
+
+    @QtCore.pyqtSlot(str, object)
+    def on_game_card_action(self, action: str, game):
+        if action == GameCardDelegate.DETAILS_ACTION:
+            self.show_game_details(game)
+        elif action == GameCardDelegate.ADD_ACTION:
+            self.add_to_my_games(game)
+        elif action == GameCardDelegate.REMOVE_ACTION:
+            self.remove_from_my_games(game)
 
     def show_game_details(self, game):
         logging.info(f"Showing details for game: {game['title']}")
+        self.ensure_details_view()
         self.tabs.setCurrentWidget(self.details_tab)
         self.current_game = game
 
-        # Display game details with bolded keys for better readability
+        # Display game details with bolded keys for better readability; this needs no I/O so it shows at once
         details = ""
         for key, value in game.items():
             if isinstance(value, list):
                 value = ', '.join(value)
+            value = '' if value is None else str(value)
             details += "<b>" + key.capitalize() + ":</b>" + value.replace('\n', '<br>') + "<br>"
         self.details_text.setHtml(details)
 
-        # Clear previous images in the details view
-        for i in reversed(range(self.image_layout.count())):
-            widget = self.image_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.deleteLater()
-
-        # Display logo and screenshot images
+        # Display logo and screenshot images; downloads and decoding fill them in asynchronously
         game_id = game['id']
 
         # Game logo
-        img_path = os.path.join(self.data_folder, f"{game_id}.png")
-        if os.path.exists(img_path):
-            pixmap = QtGui.QPixmap(img_path).scaled(ICON_IMAGE_WIDTH, ICON_IMAGE_HEIGHT, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-            logo_label = QtWidgets.QLabel()
-            logo_label.setPixmap(pixmap)
-            logo_label.setFixedSize(ICON_IMAGE_WIDTH, ICON_IMAGE_HEIGHT)
-            logo_label.setStyleSheet(f"border: 1px solid {BORDER_COLOR}; border-radius: 8px;")
-            self.image_layout.addWidget(logo_label)
+        self.set_details_image(self.details_logo_label, self.load_thumbnail(ICON_THUMBNAIL, game_id, self.game_images.path(game_id)))
 
         # Game screenshot
-        screenshot_url = f"https://infinity.unstable.life/images/Screenshots/{game_id[:2]}/{game_id[2:4]}/{game_id}.png?type=png"
-        screenshot_path = os.path.join(self.data_folder, f"{game_id}_screenshot.png")
-        if not os.path.exists(screenshot_path):
-            try:
-                logging.info(f"Fetching screenshot from URL: {screenshot_url}")
-                screenshot_data = requests.get(screenshot_url).content
-                with open(screenshot_path, 'wb') as f:
-                    f.write(screenshot_data)
-            except Exception as e:
-                logging.error(f"Error loading screenshot from URL: {screenshot_url} - {e}")
-                return
+        screenshot_pixmap = self.thumbnails.get(SCREENSHOT_THUMBNAIL, game_id)
+        if screenshot_pixmap is None and not self.request_screenshot(game_id):
+            screenshot_pixmap = QtGui.QPixmap()
+        self.set_details_image(self.details_screenshot_label, screenshot_pixmap)
 
-        screenshot_pixmap = QtGui.QPixmap(screenshot_path).scaled(SCREENSHOT_IMAGE_WIDTH, SCREENSHOT_IMAGE_HEIGHT, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-        screenshot_label = QtWidgets.QLabel()
-        screenshot_label.setPixmap(screenshot_pixmap)
-        screenshot_label.setFixedSize(SCREENSHOT_IMAGE_WIDTH, SCREENSHOT_IMAGE_HEIGHT)
-        screenshot_label.setStyleSheet(f"border: 1px solid {BORDER_COLOR}; border-radius: 8px;")
-        self.image_layout.addWidget(screenshot_label)
+        # Additional game information
+        additional_apps = self.additional_apps_cache.get(game_id)
+        if additional_apps is not None:
+            self.show_additional_apps(additional_apps)
+        else:
+            self.additional_info_text.setHtml("<b>Additional Applications:</b> Loading...")
+            self.request_additional_apps(game_id)
 
-        # Fetch and display additional game information
-        addapps_url = f"https://db-api.unstable.life/addapps?id={game_id}"
-        additional_apps = self.cache_request(addapps_url)
+        # Show or hide the Add to My Games button
+        if self.is_in_my_games(game):
+            self.add_to_my_games_button.hide()
+        else:
+            self.add_to_my_games_button.show()
+
+    def show_additional_apps(self, additional_apps):
         if additional_apps is not None:
             additional_info = "<b>Additional Applications:</b><br>"
             for app in additional_apps:
@@ -460,197 +832,428 @@ class FlashGameManager(QtWidgets.QMainWindow):
         else:
             self.additional_info_text.setHtml("<b>Additional Applications:</b> None found.")
 
-        # Show or hide the Add to My Games button
-        if game in self.my_games:
-            self.add_to_my_games_button.hide()
-        else:
-            self.add_to_my_games_button.show()
+    def request_additional_apps(self, game_id: str):
+        if game_id in self.additional_apps_cache or game_id in self.pending_additional_apps:
+            return
+        self.pending_additional_apps.add(game_id)
+        future = self.details_executor.submit(self.fetch_additional_apps, game_id)
+        future.add_done_callback(lambda f: self.additional_apps_fetched.emit(game_id, f))
+
+    @QtCore.pyqtSlot(str, object)
+    def on_additional_apps_fetched(self, game_id: str, future: Future):
+        self.pending_additional_apps.discard(game_id)
+        try:
+            additional_apps = future.result()
+        except Exception as e:
+            logging.error(f"Failed to fetch additional apps for game ID {game_id}: {e}")
+            additional_apps = None
 
-    def add_to_my_games(self, game):
-        logging.info(f"Adding game to My Games: {game['title']}")
-        if game not in self.my_games:
-            self.my_games.append(game)
-            self.update_my_games_view()
-            self.save_my_games()
+        if additional_apps is not None:
+            self.additional_apps_cache[game_id] = additional_apps
+            self.additional_apps_cache.move_to_end(game_id)
+            while len(self.additional_apps_cache) > DETAILS_CACHE_ENTRIES:
+                self.additional_apps_cache.popitem(last=False)
+        if self.current_game is not None and self.current_game['id'] == game_id:
+            self.show_additional_apps(additional_apps)
+
+    def request_screenshot(self, game_id: str) -> bool:
+        """
+        Make sure a screenshot thumbnail is on its way: decode it if the image is on disk, download it otherwise.
 
-            # Cache the screenshot in advance for offline use
+        Returns False if the screenshot is known to be missing.
+        """
+        screenshot_path = self.game_images.path(game_id, ImageStore.SCREENSHOT)
+        if self.thumbnails.request(SCREENSHOT_THUMBNAIL, game_id, screenshot_path):
+            return True
+        if game_id in self.pending_screenshots:
+            return True
+
+        screenshot_url = f"{INFINITY_URL}/images/Screenshots/{game_id[:2]}/{game_id[2:4]}/{game_id}.png?type=png"
+        logging.info(f"Fetching screenshot from URL: {screenshot_url}")
+        self.pending_screenshots.add(game_id)
+        future = self.http_client.download(screenshot_url, lambda data: self.game_images.write(game_id, data, ImageStore.SCREENSHOT))
+        future.add_done_callback(lambda f: self.screenshot_downloaded.emit(game_id, f))
+        return True
+
+    @QtCore.pyqtSlot(str, object)
+    def on_screenshot_downloaded(self, game_id: str, future: Future):
+        self.pending_screenshots.discard(game_id)
+        try:
+            screenshot_path = future.result()
+        except Exception as e:
+            logging.error(f"Error loading screenshot for game ID {game_id} - {e}")
+            if self.current_game is not None and self.current_game['id'] == game_id:
+                self.details_screenshot_label.hide()
+            return
+        self.thumbnails.request(SCREENSHOT_THUMBNAIL, game_id, screenshot_path)
+
+    def prefetch_visible_details(self):
+        # Warm the details of every card on screen so opening Details needs no round trip
+        view = self.my_games_view if self.tabs.currentWidget() is self.my_games_tab else self.results_view
+        for game in self.visible_games(view):
             game_id = game['id']
-            screenshot_url = f"https://infinity.unstable.life/images/Screenshots/{game_id[:2]}/{game_id[2:4]}/{game_id}.png?type=png"
-            screenshot_path = os.path.join(self.data_folder, f"{game_id}_screenshot.png")
-            if not os.path.exists(screenshot_path):
-                try:
-                    logging.info(f"Caching screenshot for game: {game['title']}")
-                    screenshot_data = requests.get(screenshot_url).content
-                    with open(screenshot_path, 'wb') as f:
-                        f.write(screenshot_data)
-                except Exception as e:
-                    logging.error(f"Error caching screenshot for game: {game['title']} - {e}")
-
-            # Set paths and commands compatible with Flatpak
-            flashpoint_dir = os.path.join(self.data_folder, "flashpoint-nano")
-            flash_nano = os.path.join(flashpoint_dir, "flashpoint.sh")
-
-            # Prepare the SteamTinkerLaunch command with adjusted paths
-            steamtinkerlaunch_command = [
-                self.steam_tinker_launch_exec, "addnonsteamgame",
-                f"--appname={game['title']}",
-                f"--exepath=\"{flash_nano}\"",
-                f"--launchoptions=\"{game_id}\"",
-                f"--iconpath={os.path.join(self.data_folder, f'{game_id}.png')}"
-            ]
-
-            # Debug: Print the constructed command
-            logging.debug("SteamTinkerLaunch Command: " + " ".join(steamtinkerlaunch_command))
-
-            # Execute the command if permissions allow
+            self.request_additional_apps(game_id)
+            if self.thumbnails.get(SCREENSHOT_THUMBNAIL, game_id) is None:
+                self.request_screenshot(game_id)
+
+    def visible_games(self, view: QtWidgets.QListView) -> list:
+        model = view.model()
+        viewport = view.viewport().rect()
+        first = view.indexAt(viewport.topLeft() + QtCore.QPoint(5, 5))
+        if not first.isValid():
+            return []
+        last = view.indexAt(viewport.bottomLeft() + QtCore.QPoint(5, -5))
+        last_row = last.row() if last.isValid() else model.rowCount() - 1
+        return [model.index(row, 0).data(GameListModel.GameRole) for row in range(first.row(), last_row + 1)]
+
+    def set_details_image(self, label: QtWidgets.QLabel, pixmap):
+        # None means the image is still being decoded; on_thumbnail_ready fills it in
+        label.show()
+        if pixmap is None:
+            label.clear()
+            label.setText("Loading...")
+        elif pixmap.isNull():
+            label.hide()
+        else:
+            label.setPixmap(pixmap)
+
+    @QtCore.pyqtSlot(str, str, QtGui.QPixmap)
+    def on_thumbnail_ready(self, kind: str, game_id: str, pixmap: QtGui.QPixmap):
+        if kind == ICON_THUMBNAIL:
+            self.update_game_icon(game_id, pixmap)
+        if self.current_game is not None and self.current_game['id'] == game_id:
+            label = self.details_logo_label if kind == ICON_THUMBNAIL else self.details_screenshot_label
+            self.set_details_image(label, pixmap)
+
+    @QtCore.pyqtSlot(str, str)
+    def on_thumbnail_discarded(self, kind: str, game_id: str):
+        # The unreadable file is gone, so repainting the card requests the icon again from scratch
+        if kind == ICON_THUMBNAIL:
+            self.failed_icons.discard(game_id)
+            self.results_model.refresh_game(game_id)
+            self.my_games_model.refresh_game(game_id)
+        else:
+            self.on_thumbnail_ready(kind, game_id, QtGui.QPixmap())
+
+    def fetch_additional_apps(self, game_id: str):
+        if self.catalog.is_available():
             try:
-                result = subprocess.run(steamtinkerlaunch_command, capture_output=True, text=True)
-                if result.returncode == 0:
-                    logging.info(f"The game {game['title']} was added to Steam.")
-                    self.set_status_success("Game added to your collection.", DEFAULT_STATUS_BAR_TIME)
-                else:
-                    logging.error(
-                        f"Failed to add game with SteamTinkerLaunch. "
-                        f"Command output: {result.stdout}, Command error: {result.stderr}"
-                    )
-                    self.set_status_error("Error adding game to collection.", DEFAULT_STATUS_BAR_TIME)
-            except Exception as e:
-                logging.error(f"Error executing SteamTinkerLaunch command: {e}")
-                self.set_status_error("Failed to add game due to execution error.", DEFAULT_STATUS_BAR_TIME)
+                return self.catalog.additional_apps(game_id)
+            except sqlite3.Error as e:
+                logging.error(f"Local catalog lookup failed, falling back to the API: {e}")
+        addapps_url = f"{DB_API_URL}/addapps?id={game_id}"
+        return self.cache_request(addapps_url)
+
+    def add_to_my_games(self, game):
+        logging.info(f"Adding game to My Games: {game['title']}")
+        if not self.is_in_my_games(game):
+            self.my_games.add(game)
+            self.my_games_model.append_games([game])
+            self.title_index.add([game['title']])
+
+            # Caching its images and adding it to Steam happen on the background job queue; its gamedata is
+            # fetched on a queue of its own so a slow or failed download doesn't hold up or fail the add
+            self.job_queue.enqueue(ADD_GAME_JOB, game['title'], game)
+            self.download_queue.enqueue(DOWNLOAD_GAMEDATA_JOB, game['title'], game)
+            self.update_jobs_label()
+            self.set_status_success(f"Adding {game['title']} to your collection...", DEFAULT_STATUS_BAR_TIME)
         else:
             logging.info(f"Game already in My Games: {game['title']}")
             self.set_status_warning("This game is already in your collection.", DEFAULT_STATUS_BAR_TIME)
 
-        # Update search view to reflect the change
-        self.display_search_results()
+        # Repaint only the affected search card; loaded pages and scroll position stay put
+        self.refresh_ownership(game)
 
-    def update_my_games_view(self):
-        logging.info("Updating My Games view")
-        # Clear previous my games results
-        for i in reversed(range(self.my_games_layout.count())):
-            widget = self.my_games_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.deleteLater()
-
-        # Display each game in my games
-        filter_text = self.filter_input.text().strip().lower()
-        logging.info(f"Filtering My Games with filter text: {filter_text}")
+    def cache_logo_step(self, game):
+        # Runs on a job worker; Steam needs the logo on disk for the shortcut icon
+        game_id = game['id']
+        if not self.game_images.exists(game_id):
+            img_url = f"{INFINITY_URL}/images/Logos/{game_id[:2]}/{game_id[2:4]}/{game_id}.png?type=png"
+            self.download_optional(img_url, lambda data: self.game_images.write(game_id, data))
 
-        for game in self.my_games:
-            if filter_text and filter_text not in game['title'].lower():
-                continue
+    def cache_screenshot_step(self, game):
+        # Runs on a job worker; caches the screenshot in advance for offline use
+        game_id = game['id']
+        if not self.game_images.exists(game_id, ImageStore.SCREENSHOT):
+            logging.info(f"Caching screenshot for game: {game['title']}")
+            screenshot_url = f"{INFINITY_URL}/images/Screenshots/{game_id[:2]}/{game_id[2:4]}/{game_id}.png?type=png"
+            self.download_optional(screenshot_url, lambda data: self.game_images.write(game_id, data, ImageStore.SCREENSHOT))
+
+    def download_optional(self, url: str, save):
+        # A missing image is not an error worth retrying, anything else is
+        import requests
+        try:
+            self.http_client.download_body(url, save)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                logging.warning(f"No image available at URL: {url}")
+                return
+            raise
 
-            game_frame = QtWidgets.QFrame()
-            game_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-            game_frame.setStyleSheet(f"background-color: {WIDGET_BACKGROUND_COLOR}; border: 1px solid {BORDER_COLOR}; padding: 10px; border-radius: 8px;")
-            game_layout = QtWidgets.QHBoxLayout(game_frame)
+    def add_to_steam_step(self, game):
+        # Runs on a job worker; set paths and commands compatible with Flatpak
+        game_id = game['id']
+        flash_nano = os.path.join(self.flashpoint_dir, "flashpoint.sh")
+
+        # Prepare the SteamTinkerLaunch command with adjusted paths
+        steamtinkerlaunch_command = [
+            self.steam_tinker_launch_exec, "addnonsteamgame",
+            f"--appname={game['title']}",
+            f"--exepath=\"{flash_nano}\"",
+            f"--launchoptions=\"{game_id}\"",
+            f"--iconpath={self.game_images.path(game_id)}"
+        ]
+
+        # Debug: Print the constructed command
+        logging.debug("SteamTinkerLaunch Command: " + " ".join(steamtinkerlaunch_command))
+
+        # A retry after SteamTinkerLaunch wrote the shortcut but failed, or after a crash before the job
+        # recorded the step, must not add the game to Steam a second time
+        if self.has_steam_shortcut(game_id):
+            logging.info(f"The game {game['title']} is already in Steam.")
+            return
 
-            image_layout = QtWidgets.QVBoxLayout()
+        with tracer.span("steamtinkerlaunch", "steam", game_id=game_id):
+            result = subprocess.run(steamtinkerlaunch_command, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"Failed to add game with SteamTinkerLaunch. "
+                f"Command output: {result.stdout}, Command error: {result.stderr}"
+            )
+        logging.info(f"The game {game['title']} was added to Steam.")
+
+    def has_steam_shortcut(self, game_id: str) -> bool:
+        # Shortcuts made by add_to_steam_step launch flashpoint.sh with the game id as their launch options
+        needle = f'"{game_id}"'.encode()
+        for pattern in STEAM_SHORTCUTS_FILES:
+            for path in glob.glob(pattern):
+                try:
+                    with open(path, 'rb') as file:
+                        if needle in file.read():
+                            return True
+                except OSError:
+                    continue
+        return False
+
+    def resolve_launch_plan_step(self, game):
+        # Runs on a job worker; flashpoint-nano saves the database lookups and override matching for this game
+        # so launching it from Steam goes straight to the runner. The plan is redone if the database or config changes.
+        # This is only a head start for the first launch, so it never fails the job: without a database it would
+        # download one, and entries the overrides don't cover or older scripts without --resolve just launch unplanned.
+        if not self.catalog.is_available():
+            logging.info(f"No database yet; the launch plan for {game['title']} is resolved on first launch.")
+            return
+        flash_nano = os.path.join(self.flashpoint_dir, "flashpoint.sh")
+        try:
+            result = subprocess.run([flash_nano, "--resolve", game['id']], cwd=self.flashpoint_dir, capture_output=True, text=True)
+        except OSError as e:
+            logging.warning(f"Could not resolve a launch plan for {game['title']}: {e}")
+            return
+        if result.returncode != 0:
+            logging.warning(
+                f"Could not resolve a launch plan for {game['title']}. "
+                f"Command output: {result.stdout}, Command error: {result.stderr}"
+            )
+            return
+        logging.info(f"Launch plan for {game['title']} is saved.")
+
+    def download_gamedata_step(self, game):
+        # Runs on a job worker; fetches and verifies the game data now so the first launch doesn't wait on it.
+        # Interrupted downloads leave partial files behind that the next attempt resumes from.
+        # Finding the game's data needs the catalog database, which is only downloaded when the user asks for it.
+        if not self.catalog.is_available():
+            logging.info(f"No database yet; the game data for {game['title']} is downloaded on first launch.")
+            return
+        flash_nano = os.path.join(self.flashpoint_dir, "flashpoint.sh")
+        result = subprocess.run([flash_nano, "--download", game['id']], cwd=self.flashpoint_dir, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"Failed to download game data. "
+                f"Command output: {result.stdout}, Command error: {result.stderr}"
+            )
+        logging.info(f"Game data for {game['title']} is downloaded.")
+
+    def database_sync_state(self) -> dict:
+        # Written by flashpoint-nano after every sync as key=value lines
+        state = {}
+        try:
+            with open(os.path.join(self.flashpoint_dir, 'database', 'sync.state'), 'r') as file:
+                for line in file:
+                    key, _, value = line.strip().partition('=')
+                    state[key] = value
+        except OSError:
+            pass
+        return state
+
+    def sync_database_in_background(self, download=False):
+        # Unchanged databases cost one conditional request; the catalog index picks up a new file by itself.
+        # Without a database this would be a full download, which only happens when the user asks for it.
+        if not download:
+            if not self.catalog.is_available():
+                logging.info("No catalog database yet, searching with the API until it is downloaded")
+                return
+            state = self.database_sync_state()
+            if time.time() - float(state.get('synced_at', 0)) < DATABASE_SYNC_INTERVAL:
+                logging.info(f"Catalog database was synced recently ({state.get('result')}), skipping sync")
+                return
 
-            # Fetch and display image using ImageDownloader
-            game_id = game['id']
-            img_path = os.path.join(self.data_folder, f"{game_id}.png")
-            if os.path.exists(img_path):
-                # Load the image if it exists locally
-                img_label = self.load_image_synchronously(game_id, img_path, ICON_IMAGE_WIDTH, ICON_IMAGE_HEIGHT)
-                image_layout.addWidget(img_label)
-            else:
-                # Create placeholder and download image asynchronously
-                img_label = QtWidgets.QLabel("Loading...")
-                img_label.setFixedSize(ICON_IMAGE_WIDTH, ICON_IMAGE_HEIGHT)
-                img_label.setStyleSheet(f"border: 1px solid {BORDER_COLOR}; border-radius: 8px;")
-                img_label.setSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
-                image_layout.addWidget(img_label)
-
-                img_url = f"https://infinity.unstable.life/images/Logos/{game_id[:2]}/{game_id[2:4]}/{game_id}.png?type=png"
-                downloader = ImageDownloader(game_id, img_url, img_path)
-                downloader.image_loaded.connect(self.update_image_layout)
-                setattr(self, f"downloader_{game_id}", downloader)  # Keep reference to prevent garbage collection
-
-            self.game_image_layouts_dict[game_id] = image_layout  # Store layout reference for updates
-            self.addPlatformTagToLayout(game, image_layout)
-            game_layout.addLayout(image_layout)
-
-            # Game info
-            info_layout = QtWidgets.QVBoxLayout()
-
-            self.addTitleLayout(game, info_layout)
-            self.addDescription(game, info_layout)
-
-            # Buttons
-            details_button = QtWidgets.QPushButton("Details")
-            details_button.setStyleSheet(f"background-color: {DETAILS_BUTTON_COLOR}; color: {BUTTON_TEXT_COLOR}; padding: 8px; font-size: 14px; border-radius: 4px;")
-            details_button.clicked.connect(lambda checked, g=game: self.show_game_details(g))
-
-            remove_button = QtWidgets.QPushButton("Remove")
-            remove_button.setStyleSheet(f"background-color: {REMOVE_BUTTON_COLOR}; color: {BUTTON_TEXT_COLOR}; padding: 8px; font-size: 14px; border-radius: 4px;")
-            remove_button.clicked.connect(lambda checked, g=game: self.remove_from_my_games(g))
-
-            self.add_bottom_aligned_buttons(info_layout, [details_button, remove_button], QtCore.Qt.AlignRight)
-
-            game_layout.addLayout(info_layout)
-            self.my_games_layout.addWidget(game_frame)
-
-    def addTitleLayout(self, game, info_layout: QtWidgets.QVBoxLayout):
-        title_label = QtWidgets.QLabel(f"{game['title']}")
-        title_label.setFont(QtGui.QFont("Helvetica", 14, QtGui.QFont.Bold))
-        title_label.setStyleSheet(f"color: {TEXT_COLOR};")
-        info_layout.addWidget(title_label)
-
-    def addDescription(self, game, info_layout: QtWidgets.QBoxLayout):
-        if 'originalDescription' in game:
-                description = game['originalDescription']
-                if len(description) > DESCRIPTION_CUTOFF:
-                    description = description[:DESCRIPTION_CUTOFF] + "..."
-                description_label = QtWidgets.QLabel(description)
-                description_label.setWordWrap(True)
-                description_label.setStyleSheet(f"color: {SECONDARY_TEXT_COLOR};")
-                description_label.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
-                info_layout.addWidget(description_label)
-
-    def addPlatformTagToLayout(self, game, layout: QtWidgets.QBoxLayout):
-        if 'platform' in game:
-            platform_name = game['platform']
-            platform_label = QtWidgets.QLabel(f"{platform_name}")
-            if platform_name.lower() == 'flash':
-                platform_label.setObjectName("flashTag")
-                platform_label.setStyleSheet(f"background-color: {OUTER_FLASH_TAG_COLOR}")
-            elif platform_name.lower() == 'html5':
-                platform_label.setObjectName("html5Tag")
-                platform_label.setStyleSheet(f"background-color: {OUTER_HTML5_TAG_COLOR}")
+        def sync():
+            flash_nano = os.path.join(self.flashpoint_dir, "flashpoint.sh")
+            try:
+                result = subprocess.run([flash_nano, "--sync-database"], cwd=self.flashpoint_dir, capture_output=True, text=True)
+            except OSError as e:
+                logging.error(f"Could not run flashpoint-nano to sync the catalog database: {e}")
+                self.database_synced.emit("failed")
+                return
+            if result.returncode != 0:
+                logging.error(f"Failed to sync the catalog database: {result.stdout} {result.stderr}")
+                self.database_synced.emit("failed")
+                return
+            result = self.database_sync_state().get('result')
+            logging.info(f"Catalog database sync finished: {result}")
+            self.catalog.refresh_in_background()
+            if result == 'updated':
+                self.title_index.add_from(self.catalog.titles)
+            self.database_synced.emit(result or "")
+
+        Thread(target=sync, daemon=True).start()
+
+    def download_catalog(self):
+        self.download_catalog_button.setEnabled(False)
+        self.set_status_success("Downloading the catalog database...", DEFAULT_STATUS_BAR_TIME)
+        self.sync_database_in_background(download=True)
+
+    @QtCore.pyqtSlot(str)
+    def on_database_synced(self, result: str):
+        # Only a download started from the button is reported; the regular re-checks stay quiet
+        if self.download_catalog_button.isEnabled():
+            return
+        if self.catalog.is_available():
+            self.download_catalog_button.hide()
+            self.set_status_success("Catalog database downloaded.", DEFAULT_STATUS_BAR_TIME)
+        else:
+            self.download_catalog_button.setEnabled(True)
+            self.set_status_error("Could not download the catalog database.", DEFAULT_STATUS_BAR_TIME)
+
+    def gamedata_downloads(self) -> list:
+        """
+        Reads the progress files written by flashpoint-nano's download engine.
+        :return: (game id, state, downloaded bytes, total bytes) for each download still in progress
+        """
+        downloads = []
+        progress_folder = os.path.join(self.flashpoint_dir, 'progress')
+        try:
+            entries = list(os.scandir(progress_folder))
+        except FileNotFoundError:
+            return downloads
+        now = time.time()
+        for entry in entries:
+            if entry.name.endswith('.tmp'):
+                continue
+            try:
+                if now - entry.stat().st_mtime > DOWNLOAD_PROGRESS_STALE:
+                    continue
+                with open(entry.path, 'r') as file:
+                    state, downloaded, total = file.read().split()
+            except (OSError, ValueError):
+                continue
+            if state in ('downloading', 'verifying'):
+                downloads.append((entry.name, state, int(downloaded), int(total)))
+        return downloads
+
+    @QtCore.pyqtSlot(int, str, int, int, str)
+    def on_job_progress(self, job_id: int, description: str, step_number: int, step_count: int, step_name: str):
+        self.status_bar.setStyleSheet("")
+        self.status_bar.showMessage(f"{description}: {step_name.replace('_', ' ')} ({step_number}/{step_count})", DEFAULT_STATUS_BAR_TIME)
+        self.update_jobs_label()
+
+    @QtCore.pyqtSlot(int, str, bool)
+    def on_job_finished(self, job_id: int, description: str, succeeded: bool):
+        if succeeded:
+            self.set_status_success(f"{description} added to your collection.", DEFAULT_STATUS_BAR_TIME)
+        else:
+            self.set_status_error(f"Error adding {description} to your collection.", DEFAULT_STATUS_BAR_TIME)
+        self.update_jobs_label()
+
+    @QtCore.pyqtSlot(int, str, int, int, str)
+    def on_download_progress(self, job_id: int, description: str, step_number: int, step_count: int, step_name: str):
+        self.download_progress_timer.start()
+        self.update_jobs_label()
+
+    @QtCore.pyqtSlot(int, str, bool)
+    def on_download_finished(self, job_id: int, description: str, succeeded: bool):
+        if not succeeded:
+            # The game is still in the collection; flashpoint-nano fetches the data when it is first launched
+            self.set_status_warning(f"Couldn't download game data for {description}; it will be fetched on first launch.", DEFAULT_STATUS_BAR_TIME)
+        self.update_jobs_label()
+
+    def retry_failed_jobs(self):
+        # Each job picks up at the step it failed on, so the steps that succeeded are not redone
+        count = self.job_queue.retry_failed()
+        self.set_status_success(f"Retrying {count} failed job(s)...", DEFAULT_STATUS_BAR_TIME)
+        self.update_jobs_label()
+
+    def dismiss_failed_jobs(self):
+        self.job_queue.dismiss_failed()
+        self.update_jobs_label()
+
+    def update_jobs_label(self):
+        pending = self.job_queue.pending_count()
+        failed = self.job_queue.failed_count()
+        text = f"{pending} job(s) pending" if pending else ""
+        if failed:
+            text += f"{', ' if text else ''}{failed} failed"
+        self.retry_jobs_button.setVisible(failed > 0)
+        self.dismiss_jobs_button.setVisible(failed > 0)
+
+        # Show gamedata downloads while any are queued or running, then stop polling
+        queued_downloads = self.download_queue.pending_count()
+        downloads = self.gamedata_downloads()
+        if queued_downloads > len(downloads):
+            text += f"{', ' if text else ''}{queued_downloads - len(downloads)} download(s) queued"
+        for game_id, state, downloaded, total in downloads:
+            game = self.my_games.get(game_id) if self.my_games is not None else None
+            title = game['title'] if game else game_id
+            if state == 'verifying':
+                text += f"{', ' if text else ''}verifying {title}"
+            elif total:
+                text += f"{', ' if text else ''}downloading {title} {downloaded * 100 // total}%"
             else:
-                platform_label.setObjectName("otherTag")
-                platform_label.setStyleSheet(f"background-color: {OUTER_OTHER_TAG_COLOR}")
-            platform_label.setSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)  # Force the platform label to be minimal
-            platform_label.setAlignment(QtCore.Qt.AlignCenter)  # Center-align text inside the label
-            layout.addWidget(platform_label, alignment=QtCore.Qt.AlignBottom)
-
-    def add_bottom_aligned_buttons(self, input_layout: QtWidgets.QBoxLayout, input_buttons: list[QtWidgets.QPushButton], horizontalAlignment: QtCore.Qt.AlignmentFlag):
-        horizontal_layout = QtWidgets.QHBoxLayout()
-        for button in input_buttons:
-            horizontal_layout.addWidget(button, horizontalAlignment)
-        horizontal_layout.setAlignment(QtCore.Qt.AlignBottom)
-        input_layout.addLayout(horizontal_layout)
+                text += f"{', ' if text else ''}downloading {title} {downloaded // (1024 * 1024)} MB"
+        if not downloads and not queued_downloads:
+            self.download_progress_timer.stop()
+        self.jobs_label.setText(text)
+
+    def update_my_games_view(self):
+        # Filtering only hides or shows existing rows; adds and removes patch the model directly
+        filter_text = self.filter_input.text().strip()
+        logging.info(f"Filtering My Games with filter text: {filter_text}")
+        self.my_games_proxy.set_text_filter(filter_text)
 
     def remove_from_my_games(self, game):
         logging.info(f"Removing game from My Games: {game['title']}")
-        self.my_games.remove(game)
-        self.update_my_games_view()
-        self.save_my_games()
+        self.my_games.remove(game['id'])
+        self.my_games_model.remove_game(game['id'])
         self.set_status_success("Game removed from your collection.", DEFAULT_STATUS_BAR_TIME)
-        # Update search view to reflect the change
-        self.display_search_results()
+        # Repaint only the affected search card; loaded pages and scroll position stay put
+        self.refresh_ownership(game)
 
-    def save_my_games(self):
-        logging.info("Saving My Games to file")
-        with open(self.my_games_file, 'w') as f:
-            json.dump(self.my_games, f, indent=4)
+    def refresh_ownership(self, game):
+        self.results_model.refresh_game(game['id'])
+        if self.current_game is not None and self.current_game['id'] == game['id']:
+            self.add_to_my_games_button.setVisible(not self.is_in_my_games(game))
 
     def load_my_games(self):
-        logging.info("Loading My Games from file")
-        if os.path.exists(self.my_games_file):
-            with open(self.my_games_file, 'r') as f:
-                self.my_games = json.load(f)
+        logging.info("Loading My Games")
+        self.my_games = MyGamesStore(self.my_games_file, self.legacy_my_games_file)
+        self.my_games_model.set_games(self.my_games.games())
+        self.title_index.add(game.get('title') for game in self.my_games.games())
+
+    def ensure_my_games(self) -> "MyGamesStore":
+        # Normally loaded right after the window appears, but anything that needs it sooner loads it then
+        if self.my_games is None:
+            self.load_my_games()
+        return self.my_games
 
     def set_status_warning(self, input: str, time: int):
         self.status_bar.setStyleSheet("background-color: yellow; color: black;")
@@ -667,115 +1270,1912 @@ class FlashGameManager(QtWidgets.QMainWindow):
         QtCore.QTimer.singleShot(time, lambda: self.status_bar.setStyleSheet(""))
         self.status_bar.showMessage(input, time)
 
-    def load_image_synchronously(self, game_id: str, img_path: str, img_width: int, img_height: int) -> QtWidgets.QLabel:
+    def load_thumbnail(self, kind: str, game_id: str, source_path: str):
         """
-        Load an image synchronously from a given path and return an QLabel with the image.
-        If the image is not available or fails to load, return a QLabel with a placeholder.
+        Return the pre-scaled thumbnail of a game image if it is in memory, otherwise queue it for decoding.
 
+        :param kind: ICON_THUMBNAIL or SCREENSHOT_THUMBNAIL
         :param game_id: Unique identifier for the game
-        :param img_path: Path to the image file
-        :param img_width: Width of the image to display
-        :param img_height: Height of the image to display
-        :return: QLabel containing the loaded image or a placeholder
+        :param source_path: Path to the full-size original
+        :return: QPixmap if ready, None while it is decoding, or a null QPixmap if there is no image at all
         """
-        logging.info(f"Attempting to load image for game ID {game_id} from path: {img_path}")
-
-        # Create QLabel for the image
-        img_label = QtWidgets.QLabel()
-        img_label.setFixedSize(img_width, img_height)
-        img_label.setSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
-        img_label.setStyleSheet(f"border: 1px solid {BORDER_COLOR}; border-radius: 8px;")
-
-        # Check if the image file exists
-        if os.path.exists(img_path):
-            pixmap = QtGui.QPixmap(img_path)
-            if not pixmap.isNull():
-                # Scale pixmap to desired size and set it on QLabel
-                pixmap = pixmap.scaled(img_width, img_height, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                img_label.setPixmap(pixmap)
-                logging.info(f"Image for game ID {game_id} loaded successfully.")
-            else:
-                # If pixmap is null, set placeholder text
-                logging.warning(f"Image at {img_path} could not be loaded. Using placeholder.")
-                img_label.setText("Error: Could not load image")
-        else:
-            # If image file doesn't exist, set placeholder text
-            logging.warning(f"Image file does not exist at {img_path}. Using placeholder.")
-            img_label.setText("No Image")
-
-        return img_label
+        pixmap = self.thumbnails.get(kind, game_id)
+        if pixmap is not None:
+            return pixmap
+        if self.thumbnails.request(kind, game_id, source_path):
+            return None
+        return QtGui.QPixmap()
 
 class ImageDownloader(QtCore.QObject):
-    image_loaded = QtCore.pyqtSignal(str, QtWidgets.QLabel)  # Signal emitted when image is loaded
+    image_failed = QtCore.pyqtSignal(str)  # Signal emitted when the image could not be downloaded
+    finished = QtCore.pyqtSignal(str)  # Emitted last, whether the image arrived, failed or was cancelled
+    download_finished = QtCore.pyqtSignal(object)  # Carries the finished Future back to the GUI thread
 
-    def __init__(self, game_id, img_url, img_path):
+    def __init__(self, game_id, img_url, image_store, http_client, thumbnails):
         super().__init__()
         self.game_id = game_id
         self.img_url = img_url
-        self.img_path = img_path
-        self.network_manager = QtNetwork.QNetworkAccessManager()
-        self.network_manager.finished.connect(self.on_image_downloaded)
+        self.image_store = image_store
+        self.http_client = http_client
+        self.thumbnails = thumbnails
+        self.future = None
+        self.download_finished.connect(self.on_image_downloaded)
         self.start_download()
 
     def start_download(self):
-        request = QtNetwork.QNetworkRequest(QtCore.QUrl(self.img_url))
-        self.network_manager.get(request)
+        self.future = self.http_client.fetch(self.img_url)
+        self.future.add_done_callback(self.download_finished.emit)
+
+    def cancel(self):
+        # Only a request still waiting for a worker can be cancelled; one under way is left to finish
+        self.future.cancel()
+
+    @QtCore.pyqtSlot(object)
+    def on_image_downloaded(self, future: Future):
+        try:
+            self.save_image(future)
+        finally:
+            self.finished.emit(self.game_id)
+
+    def save_image(self, future: Future):
+        if future.cancelled():
+            logging.info(f"Image download for {self.game_id} cancelled")
+            return
+        try:
+            response = future.result()
+            response.raise_for_status()
+        except Exception as e:
+            logging.error(f"Error downloading image for {self.game_id}: {e}")
+            self.image_failed.emit(self.game_id)
+            return
 
-    @QtCore.pyqtSlot(QtNetwork.QNetworkReply)
-    def on_image_downloaded(self, reply: QtNetwork.QNetworkReply):
-        if reply.error() == QtNetwork.QNetworkReply.NoError:
-            try:
-                # Read image data from the reply
-                image_data = reply.readAll().data()
-                logging.info(f"Image for {self.game_id} downloaded successfully")
-
-                # Save image to file
-                with open(self.img_path, 'wb') as f:
-                    f.write(image_data)
-                    f.flush()
-                    os.fsync(f.fileno())
-                logging.info(f"Image for {self.game_id} saved to {self.img_path}")
-
-                # Load the image for display
-                image = Image.open(BytesIO(image_data)).convert("RGBA")
-                qt_image = QtGui.QImage(
-                    image.tobytes(), image.width, image.height, QtGui.QImage.Format_RGBA8888
-                )
-                pixmap = QtGui.QPixmap.fromImage(qt_image)
-
-                # Scale the QPixmap and set it on QLabel
-                if not pixmap.isNull():
-                    pixmap = pixmap.scaled(
-                        ICON_IMAGE_WIDTH, ICON_IMAGE_HEIGHT,
-                        QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
-                    )
-                    img_label = QtWidgets.QLabel()
-                    img_label.setPixmap(pixmap)
-                    img_label.setFixedSize(ICON_IMAGE_WIDTH, ICON_IMAGE_HEIGHT)
-                    img_label.setSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
-                    logging.info(f"Image for {self.game_id} successfully loaded into QLabel.")
+        try:
+            # Read image data from the response
+            image_data = response.content
+            logging.info(f"Image for {self.game_id} downloaded successfully")
+
+            # Save image to the store, which syncs it to disk with the rest of its batch
+            img_path = self.image_store.write(self.game_id, image_data)
+            logging.info(f"Image for {self.game_id} saved to {img_path}")
+
+            # Decode and scale it on the decode pool; the result arrives through thumbnail_ready
+            self.thumbnails.request(ICON_THUMBNAIL, self.game_id, data=image_data)
+        except Exception as e:
+            logging.error(f"Failed to save image for {self.game_id}: {e}")
+            self.image_failed.emit(self.game_id)
+
+class FacetIndex:
+    """
+    Inverted indexes over the facet fields of a list of games.
+
+    Every value of every field in FACET_FIELDS maps to an int used as a bitset of the rows that
+    have it, so a combined filter is a few ANDs and a count is a popcount, no matter how many games
+    there are. Case-folded titles are kept alongside for the text filter. Games are only indexed
+    once something asks, so a collection loaded at startup costs nothing until it is filtered.
+    """
+
+    def __init__(self, fields=FACET_FIELDS):
+        self.fields = fields
+        self.postings: dict[str, dict[str, int]] = {field: {} for field in fields}
+        self.titles: list[str] = []
+        self.pending: list[dict] = []  # Games not indexed yet, in row order after the indexed ones
+        self.version = 0  # Bumped on every change so filters know to recompute
+        self.text_cache = None  # (text, version, mask) of the last text filter
+
+    def __len__(self):
+        self.index_pending()
+        return len(self.titles)
+
+    @staticmethod
+    def values(game: dict, field: str) -> list:
+        value = game.get(field)
+        if isinstance(value, list):
+            return [item for item in value if item]
+        if isinstance(value, str):
+            if ';' not in value:
+                return [value] if value else []
+            # The catalog joins multiple tags, developers and publishers with "; "
+            return [item.strip() for item in value.split(';') if item.strip()]
+        return []
+
+    def reset(self, games: list):
+        self.postings = {field: {} for field in self.fields}
+        self.titles = []
+        self.pending = list(games)
+        self.version += 1
+
+    def add(self, games: list):
+        """Queue games appended after the existing rows for indexing."""
+        self.pending.extend(games)
+        self.version += 1
+
+    def index_pending(self):
+        if not self.pending:
+            return
+        games, self.pending = self.pending, []
+        start = len(self.titles)
+        added = {field: {} for field in self.fields}
+        for row, game in enumerate(games):
+            self.titles.append((game.get('title') or '').casefold())
+            for field in self.fields:
+                for value in self.values(game, field):
+                    added[field].setdefault(value, []).append(row)
+        # Build the bits of the new rows on their own, then shift them into place once per value
+        for field, values in added.items():
+            postings = self.postings[field]
+            for value, rows in values.items():
+                postings[value] = postings.get(value, 0) | (self.bitset(rows) << start)
+
+    @staticmethod
+    def bitset(rows: list) -> int:
+        # Setting bits in a bytearray is linear; OR-ing one int per row would copy the int every time
+        data = bytearray(rows[-1] // 8 + 1)
+        for row in rows:
+            data[row >> 3] |= 1 << (row & 7)
+        return int.from_bytes(data, 'little')
+
+    def remove_row(self, row: int):
+        self.index_pending()
+        low = (1 << row) - 1
+        for postings in self.postings.values():
+            for value, bits in list(postings.items()):
+                bits = (bits & low) | ((bits >> (row + 1)) << row)
+                if bits:
+                    postings[value] = bits
                 else:
-                    logging.warning("Warning: Loaded QPixmap is null.")
-                    img_label = self.create_error_label()
+                    del postings[value]
+        del self.titles[row]
+        self.version += 1
+
+    def all_rows(self) -> int:
+        return (1 << len(self)) - 1
+
+    def mask(self, selection: dict) -> int:
+        """Rows that have every selected field value."""
+        mask = self.all_rows()
+        for field, value in selection.items():
+            mask &= self.postings[field].get(value, 0)
+        return mask
+
+    def text_mask(self, text: str) -> int:
+        """Rows whose title contains text, ignoring case."""
+        self.index_pending()
+        if self.text_cache is not None and self.text_cache[:2] == (text, self.version):
+            return self.text_cache[2]
+        needle = text.casefold()
+        bits = "".join('1' if needle in title else '0' for title in reversed(self.titles))
+        mask = int(bits, 2) if bits else 0
+        self.text_cache = (text, self.version, mask)
+        return mask
+
+    def counts(self, field: str, mask: int) -> list:
+        """(value, count) pairs of a field within mask, most common first."""
+        self.index_pending()
+        counts = []
+        for value, bits in self.postings[field].items():
+            count = (bits & mask).bit_count()
+            if count:
+                counts.append((value, count))
+        counts.sort(key=lambda item: (-item[1], item[0].casefold()))
+        return counts
+
+class GameListModel(QtCore.QAbstractListModel):
+    """List model holding the games shown in the Search and My Games tabs."""
+    GameRole = QtCore.Qt.UserRole + 1
+    IconRole = QtCore.Qt.UserRole + 2
+    OwnedRole = QtCore.Qt.UserRole + 3
+
+    def __init__(self, icon_provider, owned_provider, parent=None):
+        super().__init__(parent)
+        self.icon_provider = icon_provider
+        self.owned_provider = owned_provider
+        self.games: list[dict] = []
+        self.rows_by_id: dict[str, int] = {}
+        self.facets = FacetIndex()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.games)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.games):
+            return None
+        game = self.games[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return game.get('title', '')
+        if role == self.GameRole:
+            return game
+        if role == self.IconRole:
+            return self.icon_provider(game['id'])
+        if role == self.OwnedRole:
+            return self.owned_provider(game)
+        return None
+
+    def set_games(self, games: list):
+        self.beginResetModel()
+        self.games = list(games)
+        self.rows_by_id = {game['id']: row for row, game in enumerate(self.games)}
+        self.facets.reset(self.games)
+        self.endResetModel()
+
+    def append_games(self, games: list):
+        if not games:
+            return
+        first = len(self.games)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(games) - 1)
+        for row, game in enumerate(games, start=first):
+            self.games.append(game)
+            self.rows_by_id[game['id']] = row
+        self.facets.add(games)
+        self.endInsertRows()
+
+    def remove_game(self, game_id: str):
+        row = self.rows_by_id.pop(game_id, None)
+        if row is None:
+            return
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self.games[row]
+        for game in self.games[row:]:
+            self.rows_by_id[game['id']] -= 1
+        self.facets.remove_row(row)
+        self.endRemoveRows()
+
+    def clear(self):
+        self.set_games([])
+
+    def refresh_game(self, game_id: str):
+        # Repaint the card of a single game, e.g. once its icon arrives
+        row = self.rows_by_id.get(game_id)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+class FacetFilterProxyModel(QtCore.QSortFilterProxyModel):
+    """
+    Filters a GameListModel by facet values and title text using the model's FacetIndex.
+
+    The matching rows are worked out as one bitset per change, so deciding whether a row is shown
+    is a single bit test rather than a look at the game.
+    """
+    filter_changed = QtCore.pyqtSignal()
+
+    def __init__(self, source: GameListModel, parent=None):
+        super().__init__(parent)
+        self.setSourceModel(source)
+        self.facet_index = source.facets
+        self.selection: dict[str, str] = {}  # Field -> selected value
+        self.text = ""
+        self.accepted = b""  # One bit per source row
+        self.accepted_version = None
+
+    def set_facet(self, field: str, value):
+        if value is None:
+            self.selection.pop(field, None)
+        else:
+            self.selection[field] = value
+        self.refilter()
+
+    def set_text_filter(self, text: str):
+        text = text.strip()
+        if text != self.text:
+            self.text = text
+            self.refilter()
+
+    def refilter(self):
+        self.accepted_version = None
+        self.invalidateFilter()
+        self.filter_changed.emit()
+
+    def base_mask(self, exclude=None) -> int:
+        """Rows matching the text and every selected facet except exclude."""
+        facets = self.facet_index
+        mask = facets.mask({field: value for field, value in self.selection.items() if field != exclude})
+        if self.text:
+            mask &= facets.text_mask(self.text)
+        return mask
+
+    def facet_counts(self, field: str) -> list:
+        # Counted as if this field were not filtered, so its other values show what picking them would give
+        return self.facet_index.counts(field, self.base_mask(exclude=field))
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self.selection and not self.text:
+            return True
+        facets = self.facet_index
+        if self.accepted_version != facets.version:
+            self.accepted = self.base_mask().to_bytes((len(facets) + 7) // 8, 'little')
+            self.accepted_version = facets.version
+        return bool(self.accepted[source_row >> 3] >> (source_row & 7) & 1)
+
+class FacetBar(QtWidgets.QWidget):
+    """Combo boxes that narrow a FacetFilterProxyModel, each listing its values with live counts."""
+
+    def __init__(self, proxy: FacetFilterProxyModel, parent=None):
+        super().__init__(parent)
+        self.proxy = proxy
+        self.combos: dict[str, QtWidgets.QComboBox] = {}
+        layout = QtWidgets.QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        for field, plural in FACET_CHOICES:
+            combo = QtWidgets.QComboBox()
+            combo.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContents)
+            combo.activated.connect(lambda index, field=field: self.on_activated(field, index))
+            layout.addWidget(combo)
+            self.combos[field] = combo
+        layout.addStretch()
+
+        # Counts are refreshed once per burst of changes, e.g. after a page of results is appended
+        self.refresh_timer = QtCore.QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(0)
+        self.refresh_timer.timeout.connect(self.refresh)
+        source = proxy.sourceModel()
+        for signal in (proxy.filter_changed, source.rowsInserted, source.rowsRemoved, source.modelReset):
+            signal.connect(self.refresh_timer.start)
+        self.refresh()
+
+    def on_activated(self, field: str, index: int):
+        self.proxy.set_facet(field, self.combos[field].itemData(index))
+
+    def refresh(self):
+        with tracer.span("facet_counts", "filter"):
+            for field, plural in FACET_CHOICES:
+                combo = self.combos[field]
+                counts = self.proxy.facet_counts(field)
+                selected = self.proxy.selection.get(field)
+                listed = counts[:FACET_MAX_VALUES]
+                if selected is not None and selected not in (value for value, _ in listed):
+                    listed.append((selected, dict(counts).get(selected, 0)))
+
+                combo.clear()
+                combo.addItem(f"All {plural} ({self.proxy.base_mask(exclude=field).bit_count()})", None)
+                for value, count in listed:
+                    combo.addItem(f"{value} ({count})", value)
+                combo.setCurrentIndex(max(0, combo.findData(selected)) if selected is not None else 0)
+
+class GameCardDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Paints a game card (icon, platform tag, title, description and action buttons) directly,
+    so no per-game widgets, layouts or stylesheets are ever created.
+    """
+    action_triggered = QtCore.pyqtSignal(str, object)  # (action, game)
+
+    DETAILS_ACTION = "details"
+    ADD_ACTION = "add"
+    REMOVE_ACTION = "remove"
+    CARD_PADDING = 10
+    TAG_HEIGHT = 30
+    BUTTON_HEIGHT = 34
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QtGui.QFont("Helvetica", 14, QtGui.QFont.Bold)
+        self.text_font = QtGui.QFont()
+        self.tag_font = QtGui.QFont()
+        self.tag_font.setPixelSize(16)
+        self.button_font = QtGui.QFont()
+        self.button_font.setPixelSize(14)
+        self.button_metrics = QtGui.QFontMetrics(self.button_font)
+        self.tag_metrics = QtGui.QFontMetrics(self.tag_font)
+        self.title_height = QtGui.QFontMetrics(self.title_font).height()
+        self.card_height = ICON_IMAGE_HEIGHT + self.TAG_HEIGHT + 3 * self.CARD_PADDING
+
+    def sizeHint(self, option, index):
+        return QtCore.QSize(max(option.rect.width(), 1), self.card_height)
+
+    def button_rects(self, card: QtCore.QRect, owned: bool) -> list:
+        if owned:
+            buttons = [(self.DETAILS_ACTION, "Details", DETAILS_BUTTON_COLOR), (self.REMOVE_ACTION, "Remove", REMOVE_BUTTON_COLOR)]
+        else:
+            buttons = [(self.DETAILS_ACTION, "Details", DETAILS_BUTTON_COLOR), (self.ADD_ACTION, "Add to My Games", BUTTON_COLOR)]
+
+        # Lay the buttons out right-to-left along the bottom edge of the card
+        rects = []
+        right = card.right() - self.CARD_PADDING
+        bottom = card.bottom() - self.CARD_PADDING
+        for action, text, color in reversed(buttons):
+            width = self.button_metrics.horizontalAdvance(text) + 16
+            rect = QtCore.QRect(right - width, bottom - self.BUTTON_HEIGHT, width, self.BUTTON_HEIGHT)
+            rects.insert(0, (action, text, color, rect))
+            right -= width + 6
+        return rects
+
+    def paint(self, painter: QtGui.QPainter, option, index):
+        game = index.data(GameListModel.GameRole)
+        if game is None:
+            return
+        owned = bool(index.data(GameListModel.OwnedRole))
+        pixmap = index.data(GameListModel.IconRole)
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        card = option.rect.adjusted(1, 1, -1, -1)
+
+        # Card background
+        painter.setPen(QtGui.QColor(BORDER_COLOR))
+        painter.setBrush(QtGui.QColor(WIDGET_BACKGROUND_COLOR))
+        painter.drawRoundedRect(card, 8, 8)
+
+        # Icon
+        icon_rect = QtCore.QRect(card.left() + self.CARD_PADDING, card.top() + self.CARD_PADDING, ICON_IMAGE_WIDTH, ICON_IMAGE_HEIGHT)
+        if pixmap is None:
+            painter.setPen(QtGui.QColor(SECONDARY_TEXT_COLOR))
+            painter.drawText(icon_rect, QtCore.Qt.AlignCenter, "Loading...")
+        elif pixmap.isNull():
+            painter.setPen(QtGui.QColor(SECONDARY_TEXT_COLOR))
+            painter.drawText(icon_rect, QtCore.Qt.AlignCenter, "Error")
+        else:
+            target = QtCore.QRect(QtCore.QPoint(0, 0), pixmap.size())
+            target.moveCenter(icon_rect.center())
+            painter.drawPixmap(target, pixmap)
+
+        # Platform tag
+        platform_name = game.get('platform')
+        if platform_name:
+            if platform_name.lower() == 'flash':
+                inner, outer = INNER_FLASH_TAG_COLOR, OUTER_FLASH_TAG_COLOR
+            elif platform_name.lower() == 'html5':
+                inner, outer = INNER_HTML5_TAG_COLOR, OUTER_HTML5_TAG_COLOR
+            else:
+                inner, outer = INNER_OTHER_TAG_COLOR, OUTER_OTHER_TAG_COLOR
+            tag_width = min(self.tag_metrics.horizontalAdvance(platform_name) + 16, ICON_IMAGE_WIDTH)
+            tag_rect = QtCore.QRect(icon_rect.left(), icon_rect.bottom() + self.CARD_PADDING, tag_width, self.TAG_HEIGHT)
+            painter.setPen(QtCore.Qt.NoPen)
+            painter.setBrush(QtGui.QColor(outer))
+            painter.drawRoundedRect(tag_rect, 4, 4)
+            painter.setPen(QtGui.QColor(inner))
+            painter.setFont(self.tag_font)
+            painter.drawText(tag_rect, QtCore.Qt.AlignCenter, platform_name)
+
+        # Title and description
+        text_left = icon_rect.right() + 2 * self.CARD_PADDING
+        text_width = card.right() - self.CARD_PADDING - text_left
+        title_rect = QtCore.QRect(text_left, card.top() + self.CARD_PADDING, text_width, self.title_height)
+        painter.setFont(self.title_font)
+        painter.setPen(QtGui.QColor(TEXT_COLOR))
+        painter.drawText(title_rect, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+                         QtGui.QFontMetrics(self.title_font).elidedText(game.get('title', ''), QtCore.Qt.ElideRight, text_width))
+
+        description = game.get('originalDescription')
+        if description:
+            if len(description) > DESCRIPTION_CUTOFF:
+                description = description[:DESCRIPTION_CUTOFF] + "..."
+            description_bottom = card.bottom() - 2 * self.CARD_PADDING - self.BUTTON_HEIGHT
+            description_rect = QtCore.QRect(text_left, title_rect.bottom() + self.CARD_PADDING, text_width, description_bottom - title_rect.bottom() - self.CARD_PADDING)
+            painter.setFont(self.text_font)
+            painter.setPen(QtGui.QColor(SECONDARY_TEXT_COLOR))
+            painter.setClipRect(description_rect)
+            painter.drawText(description_rect, QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop | QtCore.Qt.TextWordWrap, description)
+            painter.setClipping(False)
+
+        # Buttons
+        painter.setFont(self.button_font)
+        for action, text, color, rect in self.button_rects(card, owned):
+            painter.setPen(QtCore.Qt.NoPen)
+            painter.setBrush(QtGui.QColor(color))
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(QtGui.QColor(BUTTON_TEXT_COLOR))
+            painter.drawText(rect, QtCore.Qt.AlignCenter, text)
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QtCore.QEvent.MouseButtonRelease and event.button() == QtCore.Qt.LeftButton:
+            card = option.rect.adjusted(1, 1, -1, -1)
+            owned = bool(index.data(GameListModel.OwnedRole))
+            for action, text, color, rect in self.button_rects(card, owned):
+                if rect.contains(event.pos()):
+                    self.action_triggered.emit(action, index.data(GameListModel.GameRole))
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+class SearchPager(QtCore.QObject):
+    """
+    Fetches search results one PAGE_SIZE page at a time.
+
+    Each page is requested once and handed out for display once, in order. While page N is on
+    screen, page N+1 is already being fetched in the background, so it can be shown the moment
+    the user scrolls near the end. Results of a superseded query are discarded.
+
+    Once every result of a query is known, the results are kept for a while. A later query that
+    narrows one of them (e.g. "mario" -> "mario kart") is answered by filtering those results
+    locally instead of asking the search backend again.
+    """
+    page_ready = QtCore.pyqtSignal(int, list)  # (page number, games), emitted in page order
+    search_failed = QtCore.pyqtSignal(str)  # query
+    page_fetched = QtCore.pyqtSignal(int, int, object)  # Internal: (generation, page number, Future)
+
+    def __init__(self, fetch_page, executor: ThreadPoolExecutor, parent=None):
+        super().__init__(parent)
+        self.fetch_page = fetch_page
+        self.executor = executor
+        self.generation = 0
+        self.supersets: OrderedDict[str, list] = OrderedDict()  # Folded query -> all of its results
+        self.page_fetched.connect(self.on_page_fetched)
+        self.reset(None)
+
+    def reset(self, query):
+        self.query = query
+        self.futures: dict[int, Future] = {}
+        self.fetched: dict[int, list] = {}
+        self.received: dict[int, list] = {}  # Every page that has arrived, shown or not
+        self.shown_pages = 0
+        self.last_page = None  # Known once a short or empty page arrives
+        self.unpaged_results = None  # Set if the server ignored the paging parameters
+        self.want_next = False
+
+    def start(self, query: str):
+        for future in self.futures.values():
+            future.cancel()
+        self.generation += 1
+        superset = self.find_superset(query)
+        self.reset(query)
+        if superset is not None:
+            # Page through the matching part of the broader results instead of fetching
+            self.unpaged_results = [game for game in superset if self.matches(game, query)]
+            logging.info(f"Answering search locally from {len(superset)} known results: {query}")
+            self.remember(query, self.unpaged_results)
+        self.show_next()
+
+    @staticmethod
+    def terms(query: str) -> list:
+        # Split and fold the way the catalog's FTS tokenizer does: on anything that is not a letter or digit,
+        # ignoring case and accents, so a query means the same to the local filter and the index
+        text = unicodedata.normalize('NFKD', query.lower())
+        return re.findall(r'[^\W_]+', "".join(char for char in text if not unicodedata.combining(char)))
+
+    @classmethod
+    def matches(cls, game: dict, query: str) -> bool:
+        # Like the catalog's FTS index, every word of the query must start a word of any indexed field
+        tags = game.get('tags') or []
+        if isinstance(tags, list):
+            tags = " ".join(tags)
+        fields = [game.get('title'), game.get('developer'), game.get('publisher'), tags, game.get('originalDescription')]
+        words = cls.terms(" ".join(field or '' for field in fields))
+        return all(any(word.startswith(term) for word in words) for term in cls.terms(query))
+
+    def find_superset(self, query: str):
+        """Return the smallest complete result set of a query that query narrows, or None."""
+        terms = self.terms(query)
+        best = None
+        for known_query, games in self.supersets.items():
+            # Each word of the known query must be a prefix of a word of the new one
+            if all(any(term.startswith(known) for term in terms) for known in known_query.split()):
+                if best is None or len(games) < len(best):
+                    best = games
+        return best
+
+    def remember(self, query: str, games: list):
+        if len(games) > SEARCH_SUPERSET_MAX_RESULTS:
+            return
+        key = " ".join(self.terms(query))
+        self.supersets[key] = games
+        self.supersets.move_to_end(key)
+        while len(self.supersets) > SEARCH_SUPERSET_ENTRIES:
+            self.supersets.popitem(last=False)
+
+    def show_next(self):
+        """Hand out the next page for display, or mark it as wanted if it has not arrived yet."""
+        if self.query is None:
+            return
+        page = self.shown_pages + 1
+        if self.last_page is not None and page > self.last_page:
+            self.want_next = False
+            return
+        if page not in self.fetched:
+            self.want_next = True
+            self.request(page)
+            return
+
+        self.want_next = False
+        self.shown_pages = page
+        self.page_ready.emit(page, self.fetched.pop(page))
+
+        # Look ahead so the following page is ready before the user reaches it
+        self.request(page + 1)
+
+    def request(self, page: int):
+        if page in self.futures or page in self.fetched:
+            return
+        if self.last_page is not None and page > self.last_page:
+            return
+        if self.unpaged_results is not None:
+            self.store_page(page, self.slice_unpaged(page))
+            return
+
+        logging.info(f"Requesting search page {page} for query: {self.query}")
+        generation = self.generation
+        future = self.executor.submit(self.fetch_page, self.query, page)
+        self.futures[page] = future
+        future.add_done_callback(lambda f: self.page_fetched.emit(generation, page, f))
+
+    @QtCore.pyqtSlot(int, int, object)
+    def on_page_fetched(self, generation: int, page: int, future: Future):
+        if generation != self.generation:
+            logging.info(f"Discarding page {page} of superseded search {generation}")
+            return
+        self.futures.pop(page, None)
+
+        try:
+            games = future.result()
+        except Exception as e:
+            logging.error(f"Search page {page} failed: {e}")
+            games = None
+        if games is None:
+            # Leave the page unrequested so scrolling can try again
+            self.want_next = False
+            if page == 1:
+                self.search_failed.emit(self.query)
+            return
+
+        if len(games) > PAGE_SIZE:
+            # The server returned everything at once; page through it locally from now on
+            self.unpaged_results = games
+            self.remember(self.query, games)
+            games = self.slice_unpaged(page)
+        self.store_page(page, games)
+
+    def store_page(self, page: int, games: list):
+        self.received[page] = games
+        if len(games) < PAGE_SIZE:
+            self.last_page = page if games else page - 1
+        if self.unpaged_results is None and self.last_page is not None and all(p in self.received for p in range(1, self.last_page + 1)):
+            self.remember(self.query, list(chain.from_iterable(self.received[p] for p in range(1, self.last_page + 1))))
+        if games:
+            self.fetched[page] = games
+        if page == 1 and not games:
+            self.page_ready.emit(1, [])
+        elif self.want_next:
+            self.show_next()
+
+    def slice_unpaged(self, page: int) -> list:
+        start = (page - 1) * PAGE_SIZE
+        return self.unpaged_results[start:start + PAGE_SIZE]
+
+class TitleIndex:
+    """
+    Sorted index of known game titles for type-ahead suggestions.
+
+    Titles are kept case-folded in a sorted list, so the suggestions for a prefix take one binary
+    search and a short scan. Titles are merged on a single background thread into a new list that
+    then replaces the old one, so lookups on the GUI thread never wait for a large batch.
+    """
+
+    def __init__(self):
+        self.entries = ([], [])  # (sorted folded titles, titles as displayed), replaced as a whole
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='titles')
+
+    def __len__(self):
+        return len(self.entries[0])
+
+    @staticmethod
+    def fold(title: str) -> str:
+        return " ".join(title.casefold().split())
+
+    def add(self, titles):
+        """Queue titles for indexing; ones already known are ignored."""
+        titles = [title for title in titles if title]
+        if titles:
+            self.executor.submit(self.merge, titles)
+
+    def add_from(self, load):
+        """Index the titles returned by load, which is called on the index thread."""
+        def load_and_merge():
+            try:
+                self.merge(load())
             except Exception as e:
-                logging.error(f"Failed to save or load image for {self.game_id}: {e}")
-                img_label = self.create_error_label()
+                logging.error(f"Failed to load titles for suggestions: {e}")
+        self.executor.submit(load_and_merge)
+
+    def merge(self, titles):
+        keys, display = self.entries
+        new = {}
+        for title in titles:
+            key = self.fold(title)
+            if not key or key in new:
+                continue
+            position = bisect_left(keys, key)
+            if position < len(keys) and keys[position] == key:
+                continue
+            new[key] = title
+        if not new:
+            return
+
+        if len(new) < 100:
+            # A few inserts are cheaper than a full merge
+            keys, display = list(keys), list(display)
+            for key, title in new.items():
+                position = bisect_left(keys, key)
+                keys.insert(position, key)
+                display.insert(position, title)
         else:
-            logging.error(f"Error downloading image for {self.game_id}: {reply.errorString()}")
-            img_label = self.create_error_label()
+            merged = sorted(chain(zip(keys, display), new.items()))
+            keys = [key for key, _ in merged]
+            display = [title for _, title in merged]
+            logging.info(f"Indexed {len(new)} titles for suggestions ({len(keys)} in total)")
+        self.entries = (keys, display)
+
+    def suggest(self, text: str, limit=SUGGESTION_LIMIT) -> list:
+        prefix = self.fold(text)
+        if not prefix:
+            return []
+        keys, display = self.entries
+        suggestions = []
+        position = bisect_left(keys, prefix)
+        while position < len(keys) and len(suggestions) < limit and keys[position].startswith(prefix):
+            suggestions.append(display[position])
+            position += 1
+        return suggestions
+
+class ImageStore:
+    """
+    Game images on disk, sharded by id prefix the way the infinity server lays them out, as
+    <folder>/<id[:2]>/<id[2:4]>/<id><suffix>.png, so no directory grows past a few hundred files.
+
+    Images are written to a temporary file and renamed into place. A durable store does not fsync
+    each one; a background thread syncs everything written since its last pass, files first and
+    then their directories, every IMAGE_SYNC_INTERVAL seconds.
+    """
+    LOGO = ""
+    SCREENSHOT = "_screenshot"
+    LEGACY_NAME = re.compile(r'^([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})(_screenshot)?\.png$')
+
+    def __init__(self, folder, durable=True):
+        self.folder = folder
+        self.durable = durable
+        self.lock = threading.Lock()
+        self.unsynced_files: set[str] = set()
+        self.unsynced_dirs: set[str] = set()
+        self.known_dirs: set[str] = set()
+        os.makedirs(folder, exist_ok=True)
+        if durable:
+            Thread(target=self.sync_loop, name='image-sync', daemon=True).start()
+
+    def path(self, game_id: str, suffix=LOGO) -> str:
+        return os.path.join(self.folder, game_id[:2], game_id[2:4], f"{game_id}{suffix}.png")
+
+    def exists(self, game_id: str, suffix=LOGO) -> bool:
+        # An empty file is what a crash before the next sync can leave behind, so it doesn't count
+        try:
+            return os.path.getsize(self.path(game_id, suffix)) > 0
+        except OSError:
+            return False
+
+    def ensure_dir(self, directory: str):
+        if directory in self.known_dirs:
+            return
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+            # New shard directories only last if the directories holding them are synced too
+            with self.lock:
+                self.unsynced_dirs.update((os.path.dirname(directory), os.path.dirname(os.path.dirname(directory))))
+        self.known_dirs.add(directory)
+
+    def write(self, game_id: str, data: bytes, suffix=LOGO) -> str:
+        """Store an image and return its path; safe to call from any thread."""
+        path = self.path(game_id, suffix)
+        self.ensure_dir(os.path.dirname(path))
+        partial_path = f"{path}.{threading.get_ident()}.part"
+        with open(partial_path, 'wb') as f:
+            f.write(data)
+        os.replace(partial_path, path)
+        if self.durable:
+            with self.lock:
+                self.unsynced_files.add(path)
+        return path
+
+    def sync_loop(self):
+        while True:
+            time.sleep(IMAGE_SYNC_INTERVAL)
+            self.sync()
+
+    def sync(self):
+        """Make every image written so far durable."""
+        with self.lock:
+            files, self.unsynced_files = self.unsynced_files, set()
+            directories, self.unsynced_dirs = self.unsynced_dirs, set()
+        if not files and not directories:
+            return
+        with tracer.span("sync_images", "disk", files=len(files)):
+            for path in files:
+                directories.add(os.path.dirname(path))
+                self.fsync(path)
+            for directory in directories:
+                self.fsync(directory)
+        logging.debug(f"Synced {len(files)} images in {len(directories)} directories")
+
+    @staticmethod
+    def fsync(path: str):
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return  # Removed since it was written
+        try:
+            os.fsync(fd)
+        except OSError as e:
+            logging.warning(f"Could not sync {path}: {e}")
+        finally:
+            os.close(fd)
+
+    def migrate(self, legacy_folder: str, keep=frozenset()) -> int:
+        """
+        Move loose <id>.png and <id>_screenshot.png files from legacy_folder into the shards.
+
+        Logos of games in keep are linked rather than moved, since Steam shortcuts point at the old
+        path. Returns how many images were linked, moved or found already moved and removed.
+        """
+        migrated = 0
+        with os.scandir(legacy_folder) as entries:
+            for entry in entries:
+                match = self.LEGACY_NAME.match(entry.name)
+                if match is None or not entry.is_file():
+                    continue
+                game_id, suffix = match.group(1), match.group(2) or self.LOGO
+                path = self.path(game_id, suffix)
+                self.ensure_dir(os.path.dirname(path))
+                try:
+                    if suffix == self.LOGO and game_id in keep:
+                        if os.path.exists(path):
+                            continue  # Linked on an earlier run
+                        os.link(entry.path, path)
+                    elif os.path.exists(path):
+                        os.remove(entry.path)
+                    else:
+                        os.replace(entry.path, path)
+                except OSError as e:
+                    logging.warning(f"Could not migrate {entry.path}: {e}")
+                    continue
+                migrated += 1
+        if migrated and self.durable:
+            with self.lock:
+                self.unsynced_dirs.add(legacy_folder)
+                self.unsynced_dirs.update(self.known_dirs)
+        return migrated
+
+class ThumbnailCache(QtCore.QObject):
+    """
+    Two-tier cache of pre-scaled game images.
+
+    The disk tier keeps one rendition per game and kind, already scaled to its display size
+    (THUMBNAIL_SIZES), so a full-size original is decoded at most once. The memory tier is a
+    bounded LRU of ready QPixmaps, so a repeat view costs a dictionary lookup. Everything that
+    needs decoding is handed to a pool of DECODE_THREADS workers and comes back through
+    thumbnail_ready on the GUI thread. A file on disk that can't be decoded, such as an image cut
+    short by a crash before it was synced, is deleted and reported through thumbnail_discarded so
+    it can be fetched again.
+    """
+    thumbnail_ready = QtCore.pyqtSignal(str, str, QtGui.QPixmap)  # (kind, game id, pixmap; null on failure)
+    thumbnail_discarded = QtCore.pyqtSignal(str, str)  # (kind, game id) whose unreadable file was deleted
+    image_decoded = QtCore.pyqtSignal(str, str, QtGui.QImage, bool)  # Internal: decode worker -> GUI thread
+
+    def __init__(self, folder, max_bytes=THUMBNAIL_MEMORY_BYTES, parent=None):
+        super().__init__(parent)
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.pixmaps: OrderedDict[tuple, QtGui.QPixmap] = OrderedDict()
+        self.total_bytes = 0
+        self.pending: set[tuple] = set()
+        self.decode_pool = QtCore.QThreadPool()
+        self.decode_pool.setMaxThreadCount(DECODE_THREADS)
+        self.image_decoded.connect(self.on_image_decoded)
+        # Renditions can always be made again, so they are never synced
+        self.renditions = {kind: ImageStore(os.path.join(folder, kind), durable=False) for kind in THUMBNAIL_SIZES}
+
+    def rendition_path(self, kind: str, game_id: str) -> str:
+        return self.renditions[kind].path(game_id)
+
+    def migrate(self) -> int:
+        return sum(store.migrate(store.folder) for store in self.renditions.values())
+
+    def has_rendition(self, kind: str, game_id: str) -> bool:
+        return os.path.exists(self.rendition_path(kind, game_id))
+
+    def get(self, kind: str, game_id: str):
+        """Return the thumbnail if it is in memory, otherwise None."""
+        key = (kind, game_id)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+        return pixmap
+
+    def request(self, kind: str, game_id: str, source_path=None, data=None) -> bool:
+        """
+        Queue a thumbnail for decoding, from its rendition if there is one, else from the original.
+
+        Returns False if there is nothing to decode it from.
+        """
+        key = (kind, game_id)
+        if key in self.pending:
+            return True
+        rendition_path = self.rendition_path(kind, game_id)
+        if data is None and not os.path.exists(rendition_path):
+            if source_path is None or not os.path.exists(source_path):
+                return False
+        else:
+            source_path = rendition_path if data is None else None
+
+        self.pending.add(key)
+        self.decode_pool.start(DecodeTask(self, kind, game_id, source_path, data, rendition_path))
+        return True
+
+    @QtCore.pyqtSlot(str, str, QtGui.QImage, bool)
+    def on_image_decoded(self, kind: str, game_id: str, image: QtGui.QImage, discarded: bool):
+        key = (kind, game_id)
+        self.pending.discard(key)
+        if discarded:
+            self.thumbnail_discarded.emit(kind, game_id)
+            return
+        if image.isNull():
+            self.thumbnail_ready.emit(kind, game_id, QtGui.QPixmap())
+            return
+        pixmap = QtGui.QPixmap.fromImage(image)
+        self.remember(key, pixmap)
+        self.thumbnail_ready.emit(kind, game_id, pixmap)
+
+    def remember(self, key: tuple, pixmap: QtGui.QPixmap):
+        old = self.pixmaps.pop(key, None)
+        if old is not None:
+            self.total_bytes -= self.pixmap_bytes(old)
+        self.pixmaps[key] = pixmap
+        self.total_bytes += self.pixmap_bytes(pixmap)
+        self.trim(self.max_bytes)
+
+    def trim(self, max_bytes: int):
+        """Evict the least recently used thumbnails until at most max_bytes are held."""
+        while self.total_bytes > max_bytes and len(self.pixmaps) > 1:
+            _, evicted = self.pixmaps.popitem(last=False)
+            self.total_bytes -= self.pixmap_bytes(evicted)
+
+    @staticmethod
+    def pixmap_bytes(pixmap: QtGui.QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+class DecodeTask(QtCore.QRunnable):
+    """Decodes one image straight at its thumbnail size on a worker thread and writes the rendition."""
+
+    def __init__(self, cache: ThumbnailCache, kind, game_id, source_path, data, rendition_path):
+        super().__init__()
+        self.cache = cache
+        self.kind = kind
+        self.game_id = game_id
+        self.source_path = source_path
+        self.data = data
+        self.rendition_path = rendition_path
+        self.discarded = False
+
+    def run(self):
+        try:
+            with tracer.span("decode", "decode", kind=self.kind, game_id=self.game_id):
+                image = self.decode()
+        except Exception as e:
+            logging.error(f"Failed to decode {self.kind} image for game ID {self.game_id}: {e}")
+            image = QtGui.QImage()
+        self.cache.image_decoded.emit(self.kind, self.game_id, image, self.discarded)
+
+    def decode(self) -> QtGui.QImage:
+        if self.data is not None:
+            buffer = QtCore.QBuffer()
+            buffer.setData(self.data)
+            buffer.open(QtCore.QIODevice.ReadOnly)
+            reader = QtGui.QImageReader(buffer)
+        else:
+            reader = QtGui.QImageReader(self.source_path)
+
+        # Ask the reader for the target size up front so formats that support it never decode at full size
+        width, height = THUMBNAIL_SIZES[self.kind]
+        size = reader.size()
+        if size.isValid() and (size.width() > width or size.height() > height):
+            reader.setScaledSize(size.scaled(width, height, QtCore.Qt.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            logging.warning(f"Could not decode {self.kind} image for game ID {self.game_id}: {reader.errorString()}")
+            if self.data is None:
+                # A bad rendition is made again from the original, and a bad original is downloaded again
+                try:
+                    os.remove(self.source_path)
+                    self.discarded = True
+                except OSError as e:
+                    logging.warning(f"Could not remove unreadable image {self.source_path}: {e}")
+            return image
+        if image.width() > width or image.height() > height:
+            image = image.scaled(width, height, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+
+        if self.source_path != self.rendition_path:
+            self.cache.renditions[self.kind].ensure_dir(os.path.dirname(self.rendition_path))
+        if self.source_path != self.rendition_path and not image.save(self.rendition_path, "PNG"):
+            logging.warning(f"Could not write {self.kind} thumbnail for game ID {self.game_id}.")
+        return image
+
+class HttpClient:
+    """
+    Shared HTTP client used for all network I/O.
+
+    A single requests.Session keeps connections alive and pooled per host, a semaphore per host
+    caps how many requests run against it at once, and concurrent requests for the same URL share
+    one in-flight Future. Timeouts and retries are configured here and nowhere else. requests is
+    imported when the first request is made, which keeps it off the startup path.
+    """
+
+    def __init__(self):
+        self.session = None
+        self.session_lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=HTTP_WORKERS, thread_name_prefix='http')
+        self.lock = threading.Lock()
+        self.host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self.in_flight: dict[tuple, Future] = {}
+
+    def get_session(self):
+        with self.session_lock:
+            if self.session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                retry = Retry(
+                    total=HTTP_RETRIES,
+                    backoff_factor=HTTP_RETRY_BACKOFF,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset(['GET', 'HEAD']),
+                )
+                adapter = HTTPAdapter(pool_maxsize=HTTP_MAX_CONNECTIONS_PER_HOST, max_retries=retry)
+                self.session = requests.Session()
+                self.session.mount('http://', adapter)
+                self.session.mount('https://', adapter)
+            return self.session
+
+    def get(self, url: str, headers=None) -> "requests.Response":
+        """Perform a GET on the calling thread, joining an identical request if one is already in flight."""
+        future, owner = self.claim(url, headers)
+        if owner:
+            self.run(future, url, headers)
+        return future.result()
+
+    def fetch(self, url: str, headers=None) -> Future:
+        """Start a GET on the worker pool and return a Future resolving to the response."""
+        future, owner = self.claim(url, headers)
+        if owner:
+            self.executor.submit(self.run, future, url, headers)
+        return future
+
+    def download(self, url: str, save) -> Future:
+        """Fetch a URL on the worker pool and pass the body to save; resolves to what save returns."""
+        return self.executor.submit(self.download_body, url, save)
+
+    def download_body(self, url: str, save):
+        response = self.get(url)
+        response.raise_for_status()
+        return save(response.content)
+
+    def claim(self, url, headers):
+        key = (url, tuple(sorted((headers or {}).items())))
+        with self.lock:
+            future = self.in_flight.get(key)
+            if future is not None:
+                logging.debug(f"Joining in-flight request for URL: {url}")
+                return future, False
+            future = Future()
+            self.in_flight[key] = future
+            future.add_done_callback(lambda f: self.release(key, f))
+            return future, True
+
+    def release(self, key, future):
+        with self.lock:
+            if self.in_flight.get(key) is future:
+                del self.in_flight[key]
+
+    def host_slot(self, url):
+        host = urllib.parse.urlparse(url).netloc
+        with self.lock:
+            if host not in self.host_slots:
+                self.host_slots[host] = threading.BoundedSemaphore(HTTP_MAX_CONNECTIONS_PER_HOST)
+            return self.host_slots[host]
+
+    def run(self, future: Future, url, headers):
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            with self.host_slot(url), tracer.span("fetch", "network", url=url):
+                response = self.get_session().get(url, headers=headers, timeout=HTTP_TIMEOUT)
+            future.set_result(response)
+        except Exception as e:
+            future.set_exception(e)
+
+class ResponseCache:
+    """
+    Indexed on-disk store for API responses.
+
+    Every entry lives in a single SQLite database that records the URL, when it was fetched,
+    when it was last used, its ETag/Last-Modified validators and its size. Entries expire per
+    endpoint (see CACHE_ENDPOINT_TTLS) and the least recently used ones are evicted once the
+    store grows past its byte quota. Hits only note their access time in memory; those are written
+    in one transaction every CACHE_ACCESS_FLUSH_INTERVAL, before evicting, and on close.
+    """
+
+    def __init__(self, cache_folder, max_bytes=CACHE_MAX_BYTES):
+        self.cache_folder = cache_folder
+        self.max_bytes = max_bytes
+        self.db_path = os.path.join(cache_folder, 'responses.sqlite')
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # Losing the last few writes in a power cut only costs refetching them
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.pending_access: dict[str, float] = {}
+        self.flushed_at = time.time()
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER NOT NULL,
+                body BLOB NOT NULL
+            )
+        """)
+        self.connection.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+        self.connection.commit()
+        self.total_bytes = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self.purge_legacy_files()
+        logging.info(f"Response cache opened at {self.db_path} ({self.total_bytes} bytes)")
+
+    def purge_legacy_files(self):
+        # Older versions wrote one <md5>.json file per URL that never expired
+        for name in os.listdir(self.cache_folder):
+            if len(name) == 37 and name.endswith('.json'):
+                try:
+                    os.remove(os.path.join(self.cache_folder, name))
+                except OSError as e:
+                    logging.warning(f"Could not remove legacy cache file {name}: {e}")
+
+    @staticmethod
+    def ttl_for(url: str) -> int:
+        path = urllib.parse.urlparse(url).path
+        return CACHE_ENDPOINT_TTLS.get(path, CACHE_DEFAULT_TTL)
 
-        # Emit signal to notify main widget to update layout
-        self.image_loaded.emit(self.game_id, img_label)
-        reply.deleteLater()
+    def lookup(self, url: str):
+        """
+        Return the cached entry for a URL as a dict, or None if there is none.
+
+        The returned dict carries the decoded data along with its validators and an
+        'age' and 'ttl' so the caller can decide whether it is fresh, stale or expired.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT fetched_at, etag, last_modified, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            self.pending_access[url] = now
+            if now - self.flushed_at >= CACHE_ACCESS_FLUSH_INTERVAL:
+                self.flush_access_times()
+                self.connection.commit()
+        fetched_at, etag, last_modified, body = row
+        try:
+            data = json.loads(body)
+        except ValueError as e:
+            logging.error(f"Corrupt cache entry for URL: {url} - {e}")
+            self.remove(url)
+            return None
+        return {
+            'data': data,
+            'etag': etag,
+            'last_modified': last_modified,
+            'age': now - fetched_at,
+            'ttl': self.ttl_for(url),
+        }
+
+    def flush_access_times(self):
+        # Must be called with the lock held; the caller commits
+        if self.pending_access:
+            self.connection.executemany(
+                "UPDATE responses SET last_access = MAX(last_access, ?) WHERE url = ?",
+                [(accessed, url) for url, accessed in self.pending_access.items()]
+            )
+            self.pending_access.clear()
+        self.flushed_at = time.time()
+
+    def close(self):
+        with self.lock:
+            self.flush_access_times()
+            self.connection.commit()
+
+    def cached_data(self, path: str) -> list:
+        """Return the decoded data of every cached response for an endpoint path, e.g. '/search'."""
+        with self.lock:
+            rows = self.connection.execute("SELECT url, body FROM responses WHERE url LIKE ?", (f"%{path}?%",)).fetchall()
+        data = []
+        for url, body in rows:
+            if urllib.parse.urlparse(url).path != path:
+                continue
+            try:
+                data.append(json.loads(body))
+            except ValueError:
+                continue
+        return data
+
+    def store(self, url: str, body: bytes, etag=None, last_modified=None):
+        now = time.time()
+        with self.lock:
+            old = self.connection.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses (url, fetched_at, last_access, etag, last_modified, size, body) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, now, now, etag, last_modified, len(body), body)
+            )
+            self.total_bytes += len(body) - (old[0] if old else 0)
+            self.evict()
+            self.connection.commit()
+
+    def mark_revalidated(self, url: str):
+        # The server answered 304 Not Modified, so the entry is fresh again
+        now = time.time()
+        with self.lock:
+            self.connection.execute("UPDATE responses SET fetched_at = ?, last_access = ? WHERE url = ?", (now, now, url))
+            self.connection.commit()
+
+    def remove(self, url: str):
+        with self.lock:
+            old = self.connection.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            if old is not None:
+                self.connection.execute("DELETE FROM responses WHERE url = ?", (url,))
+                self.total_bytes -= old[0]
+                self.connection.commit()
+
+    def evict(self):
+        # Must be called with the lock held; drops least recently used entries until under quota
+        if self.total_bytes > self.max_bytes:
+            self.flush_access_times()
+        while self.total_bytes > self.max_bytes:
+            rows = self.connection.execute(
+                "SELECT url, size FROM responses ORDER BY last_access LIMIT 32"
+            ).fetchall()
+            if not rows:
+                self.total_bytes = 0
+                break
+            for url, size in rows:
+                self.connection.execute("DELETE FROM responses WHERE url = ?", (url,))
+                self.total_bytes -= size
+                logging.info(f"Evicted cached response for URL: {url}")
+                if self.total_bytes <= self.max_bytes:
+                    break
+
+class Catalog:
+    """
+    Read-only access to the local Flashpoint database that flashpoint-nano downloads.
+
+    Queries run on a small pool of read-only connections. Full-text search uses an FTS5 index
+    over title, developer, publisher, tags and description. The index lives in its own database,
+    because the catalog is never written to, and is brought up to date incrementally whenever the
+    catalog file changes.
+    """
+
+    def __init__(self, database_path, index_path, readers=CATALOG_READERS):
+        self.database_path = database_path
+        self.index_path = index_path
+        self.readers = queue.Queue()
+        self.reader_count = 0
+        self.max_readers = readers
+        self.epoch = 0  # Bumped whenever the catalog file is replaced so stale readers get recycled
+        self.lock = threading.Lock()
+        self.refresh_lock = threading.Lock()
+        self.indexed_signature = None
+        self.refreshing = False
+
+        index = sqlite3.connect(self.index_path)
+        index.execute("PRAGMA journal_mode=WAL")
+        index.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        index.execute("CREATE TABLE IF NOT EXISTS indexed_games (id TEXT PRIMARY KEY, fts_rowid INTEGER NOT NULL, date_modified TEXT)")
+        index.execute("CREATE VIRTUAL TABLE IF NOT EXISTS game_fts USING fts5(id UNINDEXED, title, developer, publisher, tags, description, tokenize='unicode61 remove_diacritics 2')")
+        index.commit()
+        row = index.execute("SELECT value FROM meta WHERE key = 'signature'").fetchone()
+        self.indexed_signature = row[0] if row else None
+        index.close()
+
+    def is_available(self) -> bool:
+        return os.path.exists(self.database_path)
+
+    def is_ready(self) -> bool:
+        # Ready once an index exists for some version of the catalog; a newer file triggers a refresh
+        if not self.is_available() or self.indexed_signature is None:
+            return False
+        if self.signature() != self.indexed_signature:
+            self.refresh_in_background()
+        return True
+
+    def signature(self):
+        try:
+            stat = os.stat(self.database_path)
+        except OSError:
+            return None
+        return f"{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def open_reader(self):
+        connection = sqlite3.connect(f"file:{self.index_path}?mode=ro", uri=True, check_same_thread=False)
+        connection.execute("ATTACH DATABASE ? AS catalog", (f"file:{self.database_path}?mode=ro",))
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    @contextlib.contextmanager
+    def reader(self):
+        """Borrow a pooled read-only connection with the catalog attached as 'catalog'."""
+        epoch = self.epoch
+        try:
+            connection, connection_epoch = self.readers.get_nowait()
+        except queue.Empty:
+            with self.lock:
+                can_open = self.reader_count < self.max_readers
+                if can_open:
+                    self.reader_count += 1
+            if can_open:
+                connection, connection_epoch = self.open_reader(), epoch
+            else:
+                connection, connection_epoch = self.readers.get()
+
+        if connection_epoch != epoch:
+            connection.close()
+            connection, connection_epoch = self.open_reader(), epoch
+        try:
+            yield connection
+        finally:
+            self.readers.put((connection, connection_epoch))
+
+    def catalog_columns(self, connection) -> dict:
+        # Map the fields we need onto whatever this version of the schema calls them
+        columns = {row[1] for row in connection.execute("PRAGMA catalog.table_info(game)")}
+        def pick(*names):
+            for name in names:
+                if name in columns:
+                    return f"g.{name}"
+            return "''"
+        # Like the API's filter=true, leave out extreme and broken entries; None if the schema can't tell them apart
+        hidden = [f"coalesce(g.{name}, 0)" for name in ('extreme', 'broken') if name in columns]
+        return {
+            'hidden': " OR ".join(hidden) if hidden else None,
+            'platform': pick('platformName', 'platform'),
+            'library': pick('library'),
+            'tags': pick('tagsStr'),
+            'description': pick('originalDescription'),
+            'date_added': pick('dateAdded'),
+            'date_modified': pick('dateModified'),
+        }
+
+    def refresh_in_background(self):
+        with self.lock:
+            if self.refreshing or not self.is_available():
+                return
+            self.refreshing = True
+        Thread(target=self.refresh_index, daemon=True).start()
+
+    def refresh_index(self):
+        """Bring the FTS index in line with the catalog, touching only games that changed."""
+        try:
+            with self.refresh_lock:
+                signature = self.signature()
+                if signature is None or signature == self.indexed_signature:
+                    return
+                logging.info(f"Refreshing catalog index for {self.database_path}")
+                started = time.time()
+
+                index = sqlite3.connect(self.index_path, uri=True)
+                index.execute("ATTACH DATABASE ? AS catalog", (f"file:{self.database_path}?mode=ro",))
+                columns = self.catalog_columns(index)
+                with index:
+                    # Forget games that are gone or have changed since they were indexed
+                    stale = index.execute(f"""
+                        SELECT i.id, i.fts_rowid FROM indexed_games i
+                        LEFT JOIN catalog.game g ON g.id = i.id
+                        WHERE g.id IS NULL OR COALESCE({columns['date_modified']}, '') != COALESCE(i.date_modified, '')
+                    """).fetchall()
+                    index.executemany("DELETE FROM game_fts WHERE rowid = ?", [(rowid,) for _, rowid in stale])
+                    index.executemany("DELETE FROM indexed_games WHERE id = ?", [(game_id,) for game_id, _ in stale])
+
+                    # Index games that are new or changed
+                    pending = index.execute(f"""
+                        SELECT g.id, g.title, g.developer, g.publisher, {columns['tags']}, {columns['description']}, {columns['date_modified']}
+                        FROM catalog.game g LEFT JOIN indexed_games i ON i.id = g.id
+                        WHERE i.id IS NULL
+                    """)
+                    added = 0
+                    while True:
+                        rows = pending.fetchmany(CATALOG_INDEX_BATCH)
+                        if not rows:
+                            break
+                        for game_id, title, developer, publisher, tags, description, date_modified in rows:
+                            cursor = index.execute(
+                                "INSERT INTO game_fts (id, title, developer, publisher, tags, description) VALUES (?, ?, ?, ?, ?, ?)",
+                                (game_id, title, developer, publisher, tags, description)
+                            )
+                            index.execute("INSERT INTO indexed_games (id, fts_rowid, date_modified) VALUES (?, ?, ?)", (game_id, cursor.lastrowid, date_modified))
+                        added += len(rows)
+                    index.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('signature', ?)", (signature,))
+                index.execute("INSERT INTO game_fts (game_fts) VALUES ('optimize')")
+                index.commit()
+                index.close()
+
+                self.indexed_signature = signature
+                self.epoch += 1
+                logging.info(f"Catalog index refreshed in {time.time() - started:.1f}s ({len(stale)} removed, {added} indexed)")
+        except sqlite3.Error as e:
+            logging.error(f"Failed to refresh catalog index: {e}")
+        finally:
+            with self.lock:
+                self.refreshing = False
+
+    @staticmethod
+    def fts_query(query: str) -> str:
+        # Every word must match, as a prefix, in any indexed column; SearchPager narrows results by the same words
+        return " ".join(f'"{term}"*' for term in SearchPager.terms(query))
+
+    def search(self, query: str, limit: int, offset: int) -> list:
+        match = self.fts_query(query)
+        if not match:
+            return []
+        with self.reader() as connection:
+            columns = self.catalog_columns(connection)
+            if columns['hidden'] is None:
+                raise sqlite3.NotSupportedError("the catalog has no extreme or broken columns to filter results by")
+            rows = connection.execute(f"""
+                SELECT g.id, g.title, g.developer, g.publisher, {columns['platform']} AS platform, {columns['library']} AS library,
+                       {columns['tags']} AS tags, {columns['description']} AS originalDescription,
+                       {columns['date_added']} AS dateAdded, {columns['date_modified']} AS dateModified
+                FROM game_fts f JOIN catalog.game g ON g.id = f.id
+                WHERE game_fts MATCH ? AND NOT ({columns['hidden']})
+                ORDER BY bm25(game_fts, 0.0, 10.0, 3.0, 3.0, 2.0, 1.0)
+                LIMIT ? OFFSET ?
+            """, (match, limit, offset)).fetchall()
+        games = []
+        for row in rows:
+            game = dict(row)
+            game['tags'] = [tag for tag in (game['tags'] or '').split('; ') if tag]
+            games.append(game)
+        return games
+
+    def titles(self) -> list:
+        with self.reader() as connection:
+            return [row[0] for row in connection.execute("SELECT title FROM catalog.game")]
+
+    def additional_apps(self, game_id: str) -> list:
+        with self.reader() as connection:
+            rows = connection.execute(
+                "SELECT id, name, applicationPath, launchCommand FROM catalog.additional_app WHERE parentGameId = ?", (game_id,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+class MyGamesStore:
+    """
+    The user's game collection, keyed by game id.
+
+    Games are kept in memory in insertion order for O(1) membership checks and persisted in
+    SQLite, one row per game, so adding or removing a game writes only that row inside a
+    journaled transaction. The old my_games.json is migrated once and then renamed.
+    """
+
+    def __init__(self, db_path, legacy_json_path=None):
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=FULL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS games (
+                id TEXT PRIMARY KEY,
+                position INTEGER NOT NULL,
+                data TEXT NOT NULL
+            )
+        """)
+        self.connection.commit()
+        if legacy_json_path is not None and os.path.exists(legacy_json_path):
+            self.migrate(legacy_json_path)
+
+        self.by_id: dict[str, dict] = {}
+        for game_id, data in self.connection.execute("SELECT id, data FROM games ORDER BY position"):
+            self.by_id[game_id] = json.loads(data)
+        self.next_position = self.connection.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM games").fetchone()[0]
+        logging.info(f"Loaded {len(self.by_id)} games from {db_path}")
+
+    def migrate(self, legacy_json_path):
+        logging.info(f"Migrating My Games from {legacy_json_path}")
+        try:
+            with open(legacy_json_path, 'r') as f:
+                games = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.error(f"Could not read {legacy_json_path}, leaving it in place: {e}")
+            return
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO games (id, position, data) VALUES (?, ?, ?)",
+                [(game['id'], position, json.dumps(game)) for position, game in enumerate(games)]
+            )
+        os.replace(legacy_json_path, f"{legacy_json_path}.migrated")
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def contains(self, game_id: str) -> bool:
+        return game_id in self.by_id
+
+    def games(self) -> list:
+        return list(self.by_id.values())
+
+    def get(self, game_id: str):
+        return self.by_id.get(game_id)
+
+    def add(self, game):
+        with self.lock:
+            if game['id'] in self.by_id:
+                return
+            with self.connection:
+                self.connection.execute("INSERT INTO games (id, position, data) VALUES (?, ?, ?)", (game['id'], self.next_position, json.dumps(game)))
+            self.next_position += 1
+            self.by_id[game['id']] = game
+
+    def remove(self, game_id: str):
+        with self.lock:
+            if self.by_id.pop(game_id, None) is None:
+                return
+            with self.connection:
+                self.connection.execute("DELETE FROM games WHERE id = ?", (game_id,))
+
+class JobQueue(QtCore.QObject):
+    """
+    Persistent queue of multi-step background jobs.
+
+    Jobs are stored in SQLite together with the step they have reached, so a job interrupted by a
+    crash or restart resumes where it left off. Steps run on a pool of JOB_WORKERS threads, failed
+    steps are retried with exponential backoff, and steps listed in EXCLUSIVE_JOB_STEPS never run
+    concurrently with themselves. A job that still fails is kept until it is retried or dismissed,
+    or until it expires after JOB_FAILED_EXPIRY.
+    """
+    job_progress = QtCore.pyqtSignal(int, str, int, int, str)  # (job id, description, step number, step count, step name)
+    job_finished = QtCore.pyqtSignal(int, str, bool)  # (job id, description, succeeded)
+
+    def __init__(self, db_path, workers=JOB_WORKERS, parent=None):
+        super().__init__(parent)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                description TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                step INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'queued',
+                error TEXT,
+                updated REAL NOT NULL
+            )
+        """)
+        self.connection.commit()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='job')
+        self.step_handlers = {}
+        self.step_locks = {name: threading.Lock() for name in EXCLUSIVE_JOB_STEPS}
+
+    def register_step(self, name: str, handler):
+        self.step_handlers[name] = handler
+
+    def execute(self, sql, parameters=()):
+        with self.lock:
+            cursor = self.connection.execute(sql, parameters)
+            self.connection.commit()
+            return cursor
+
+    def enqueue(self, kind: str, description: str, payload) -> int:
+        job_id = self.execute(
+            "INSERT INTO jobs (kind, description, payload, updated) VALUES (?, ?, ?, ?)",
+            (kind, description, json.dumps(payload), time.time())
+        ).lastrowid
+        logging.info(f"Queued {kind} job {job_id}: {description}")
+        self.executor.submit(self.run_job, job_id)
+        return job_id
+
+    def resume(self):
+        # Jobs that were running when the app last stopped go back in the queue; failures nobody retried expire
+        self.execute("UPDATE jobs SET status = 'queued' WHERE status = 'running'")
+        expired = self.execute("DELETE FROM jobs WHERE status = 'failed' AND updated < ?", (time.time() - JOB_FAILED_EXPIRY,)).rowcount
+        if expired:
+            logging.info(f"Dropped {expired} failed job(s) older than {JOB_FAILED_EXPIRY // 86400} days")
+        with self.lock:
+            job_ids = [row[0] for row in self.connection.execute("SELECT id FROM jobs WHERE status = 'queued' ORDER BY id")]
+        for job_id in job_ids:
+            logging.info(f"Resuming job {job_id}")
+            self.executor.submit(self.run_job, job_id)
+
+    def retry_failed(self) -> int:
+        """Queue every failed job again from the step it failed on; return how many there were."""
+        with self.lock:
+            job_ids = [row[0] for row in self.connection.execute("SELECT id FROM jobs WHERE status = 'failed' ORDER BY id")]
+            self.connection.execute("UPDATE jobs SET status = 'queued', error = NULL, updated = ? WHERE status = 'failed'", (time.time(),))
+            self.connection.commit()
+        for job_id in job_ids:
+            logging.info(f"Retrying job {job_id}")
+            self.executor.submit(self.run_job, job_id)
+        return len(job_ids)
+
+    def dismiss_failed(self):
+        count = self.execute("DELETE FROM jobs WHERE status = 'failed'").rowcount
+        logging.info(f"Dismissed {count} failed job(s)")
+
+    def pending_count(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM jobs WHERE status IN ('queued', 'running')").fetchone()[0]
+
+    def failed_count(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM jobs WHERE status = 'failed'").fetchone()[0]
+
+    def run_job(self, job_id: int):
+        with self.lock:
+            row = self.connection.execute("SELECT kind, description, payload, step FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return
+        kind, description, payload, step = row
+        payload = json.loads(payload)
+        steps = JOB_STEPS[kind]
+        self.execute("UPDATE jobs SET status = 'running', updated = ? WHERE id = ?", (time.time(), job_id))
+
+        for index in range(step, len(steps)):
+            name = steps[index]
+            self.job_progress.emit(job_id, description, index + 1, len(steps), name)
+            error = self.run_step(name, payload)
+            if error is not None:
+                logging.error(f"Job {job_id} ({description}) failed at step {name}: {error}")
+                self.execute("UPDATE jobs SET status = 'failed', error = ?, updated = ? WHERE id = ?", (error, time.time(), job_id))
+                self.job_finished.emit(job_id, description, False)
+                return
+            self.execute("UPDATE jobs SET step = ?, updated = ? WHERE id = ?", (index + 1, time.time(), job_id))
+
+        self.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        logging.info(f"Job {job_id} ({description}) finished")
+        self.job_finished.emit(job_id, description, True)
+
+    def run_step(self, name: str, payload):
+        """Run one step with retries; return None on success or the last error message."""
+        handler = self.step_handlers[name]
+        lock = self.step_locks.get(name) or contextlib.nullcontext()
+        delay = JOB_RETRY_BACKOFF
+        error = None
+        for attempt in range(1, JOB_MAX_ATTEMPTS + 1):
+            try:
+                with lock:
+                    handler(payload)
+                return None
+            except Exception as e:
+                error = str(e)
+                logging.warning(f"Step {name} failed (attempt {attempt}/{JOB_MAX_ATTEMPTS}): {e}")
+                if attempt < JOB_MAX_ATTEMPTS:
+                    time.sleep(delay)
+                    delay *= 2
+        return error
+
+class Tracer:
+    """
+    In-memory recorder of timed spans, exported in the Chrome trace event format so a session can
+    be opened in chrome://tracing or Perfetto. Recording a span is cheap enough to leave on all the
+    time; only the most recent TRACE_MAX_EVENTS are kept.
+    """
+
+    def __init__(self, max_events=TRACE_MAX_EVENTS):
+        self.events = deque(maxlen=max_events)
+        self.thread_names: dict[int, str] = {}
+        self.lock = threading.Lock()
+        self.origin = time.perf_counter()
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, **args):
+        """Time the body of a with block as one span; args are shown alongside it in the viewer."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, category, started, time.perf_counter() - started, args)
+
+    def record(self, name: str, category: str, started: float, duration: float, args=None):
+        thread = threading.current_thread()
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': (started - self.origin) * 1e6,
+            'dur': duration * 1e6,
+            'pid': os.getpid(),
+            'tid': thread.native_id,
+            'args': args or {},
+        }
+        with self.lock:
+            self.thread_names[thread.native_id] = thread.name
+            self.events.append(event)
+
+    def counter(self, name: str, category: str, values: dict):
+        """Record a sample of one or more counters, drawn as a graph in the viewer."""
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'C',
+            'ts': (time.perf_counter() - self.origin) * 1e6,
+            'pid': os.getpid(),
+            'args': values,
+        }
+        with self.lock:
+            self.events.append(event)
+
+    def export(self, path: str) -> int:
+        """Write the recorded spans to path and return how many there were."""
+        with self.lock:
+            events = list(self.events)
+            thread_names = dict(self.thread_names)
+        metadata = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid, 'args': {'name': name}}
+            for tid, name in thread_names.items()
+        ]
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        partial_path = f"{path}.part"
+        with open(partial_path, 'w') as file:
+            json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}, file, default=str)
+        os.replace(partial_path, path)
+        return len(events)
+
+
+tracer = Tracer()
+
+
+class StallWatchdog(QtCore.QObject):
+    """
+    Reports when the GUI event loop is blocked.
+
+    A timer on the GUI thread records a heartbeat every WATCHDOG_HEARTBEAT ms. A background thread
+    notices when heartbeats stop for longer than STALL_THRESHOLD and logs where the GUI thread is
+    stuck; once the loop recovers, the whole stall is logged and recorded as a trace span.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.gui_thread_id = threading.get_ident()
+        self.last_beat = time.perf_counter()
+        self.reported = False
+        self.stall_count = 0
+        self.stopped = threading.Event()
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(WATCHDOG_HEARTBEAT)
+        self.timer.timeout.connect(self.beat)
+        self.timer.start()
+        Thread(target=self.watch, name='watchdog', daemon=True).start()
+
+    def beat(self):
+        now = time.perf_counter()
+        # One heartbeat interval of the gap is the timer itself
+        blocked = now - self.last_beat - WATCHDOG_HEARTBEAT / 1000
+        if blocked * 1000 > STALL_THRESHOLD:
+            self.stall_count += 1
+            logging.warning(f"Event loop was blocked for {blocked * 1000:.0f} ms")
+            tracer.record("event_loop_stall", "watchdog", now - blocked, blocked)
+        self.last_beat = now
+        self.reported = False
+
+    def watch(self):
+        # Runs on its own thread, so it can see the GUI thread while it is stuck
+        while not self.stopped.wait(WATCHDOG_HEARTBEAT / 1000):
+            blocked = time.perf_counter() - self.last_beat - WATCHDOG_HEARTBEAT / 1000
+            if blocked * 1000 > STALL_THRESHOLD and not self.reported:
+                self.reported = True
+                frame = sys._current_frames().get(self.gui_thread_id)
+                stack = "".join(traceback.format_stack(frame)) if frame is not None else "unavailable\n"
+                logging.warning(f"Event loop blocked for over {STALL_THRESHOLD} ms, GUI thread is at:\n{stack}")
+
+    def stop(self):
+        self.timer.stop()
+        self.stopped.set()
+
+
+class MemoryMonitor(QtCore.QObject):
+    """
+    Keeps the process within a memory budget.
+
+    Every MEMORY_CHECK_INTERVAL ms the resident set size is read from /proc/self/statm and logged,
+    and recorded as a trace counter, together with the live object counts from report(). Past the
+    budget, trim() is asked to drop whatever can be fetched or decoded again.
+    """
+
+    def __init__(self, report, trim, budget=MEMORY_BUDGET_BYTES, parent=None):
+        super().__init__(parent)
+        self.report = report
+        self.trim = trim
+        self.budget = budget
+        self.trim_count = 0
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(MEMORY_CHECK_INTERVAL)
+        self.timer.timeout.connect(self.check)
+        self.timer.start()
+
+    @staticmethod
+    def rss_bytes():
+        """Resident set size of this process, or None where /proc is not available."""
+        try:
+            with open('/proc/self/statm', 'r') as file:
+                resident_pages = int(file.read().split()[1])
+        except (OSError, ValueError, IndexError):
+            return None
+        return resident_pages * os.sysconf('SC_PAGE_SIZE')
+
+    def check(self):
+        rss = self.rss_bytes()
+        if rss is None:
+            logging.info("Resident memory size is not available on this system, memory monitor stopped")
+            self.timer.stop()
+            return
+        counts = self.report()
+        tracer.counter("memory", "memory", {'rss_mb': rss // (1024 * 1024), **counts})
+        logging.debug(f"Memory: {rss // (1024 * 1024)} MB resident, " + ", ".join(f"{name} {count}" for name, count in counts.items()))
+        if rss <= self.budget:
+            return
+
+        self.trim_count += 1
+        logging.warning(f"Resident memory {rss // (1024 * 1024)} MB is over the {self.budget // (1024 * 1024)} MB budget, trimming caches")
+        with tracer.span("trim_memory", "memory"):
+            self.trim()
+            gc.collect()
+        rss = self.rss_bytes()
+        logging.info(f"Memory after trimming: {rss // (1024 * 1024)} MB resident")
+
+    def stop(self):
+        self.timer.stop()
+
+
+class StartupProfiler:
+    """
+    Times the phases of startup, from the first import to an interactive window with My Games loaded.
+    Each run is logged and appended to a JSON history so that time-to-interactive can be watched
+    across releases; runs over STARTUP_BUDGET_MS are logged as warnings.
+    """
+
+    def __init__(self, started: float):
+        self.started = started
+        self.last = started
+        self.phases: list[tuple[str, float]] = []
+        self.finished = False
+
+    def mark(self, phase: str):
+        """Record the time since the previous mark as the duration of phase."""
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self.last) * 1000))
+        self.last = now
+
+    def total_ms(self) -> float:
+        return (self.last - self.started) * 1000
+
+    def finish(self, history_path: str):
+        if self.finished:
+            return
+        self.finished = True
+        total = self.total_ms()
+        summary = ", ".join(f"{phase} {duration:.0f} ms" for phase, duration in self.phases)
+        logging.info(f"Startup took {total:.0f} ms: {summary}")
+
+        history = []
+        try:
+            with open(history_path, 'r') as file:
+                history = json.load(file)
+        except (OSError, ValueError):
+            pass
+        previous = sorted(run['total_ms'] for run in history)
+        if previous:
+            logging.info(f"Median startup over the last {len(previous)} runs: {previous[len(previous) // 2]:.0f} ms")
+        if total > STARTUP_BUDGET_MS:
+            logging.warning(f"Startup took {total:.0f} ms, over the {STARTUP_BUDGET_MS} ms budget")
+
+        history.append({
+            'time': time.time(),
+            'total_ms': round(total, 1),
+            'phases': {phase: round(duration, 1) for phase, duration in self.phases},
+        })
+        try:
+            with open(history_path, 'w') as file:
+                json.dump(history[-STARTUP_HISTORY_ENTRIES:], file, indent=4)
+        except OSError as e:
+            logging.error(f"Could not save startup times: {e}")
 
-    def create_error_label(self):
-        """Create a label indicating an error in loading the image."""
-        error_label = QtWidgets.QLabel("Error")
-        error_label.setFixedSize(ICON_IMAGE_WIDTH, ICON_IMAGE_HEIGHT)
-        error_label.setSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
-        return error_label
 
 if __name__ == "__main__":
+    startup_profiler = StartupProfiler(STARTUP_STARTED)
+    startup_profiler.mark("imports")
     logging.info("Starting FlashGameManager application")
     app = QtWidgets.QApplication(sys.argv)
     # Create stylesheet with variables
@@ -847,6 +3247,8 @@ if __name__ == "__main__":
         border-radius: 4px;
     }}
 """)
-    window = FlashGameManager()
+    startup_profiler.mark("qt_init")
+    window = FlashGameManager(startup_profiler)
     window.show()
+    startup_profiler.mark("window")
     sys.exit(app.exec_())
@@ -17,10 +17,16 @@ if [ ! -d "$FLASHPOINT_TARGET_DATA_DIR" ]; then
     mkdir -p "$FLASHPOINT_TARGET_DATA_DIR"
 
     # Copy the Flashpoint folder and its contents to the target data directory
-    cp -r flashpoint-nano/* "$FLASHPOINT_TARGET_DATA_DIR"
+    cp -rp flashpoint-nano/* "$FLASHPOINT_TARGET_DATA_DIR"
     echo "Flashpoint folder copied to $FLASHPOINT_TARGET_DATA_DIR"
 else
-    echo "Flashpoint folder already exists at $FLASHPOINT_TARGET_DATA_DIR; skipping copy."
+    # Refresh the scripts that are older than the bundled ones; config.sh is the user's, and the scripts
+    # fall back to defaults for any setting it doesn't have yet
+    for script in flashpoint-nano/*.sh flashpoint-nano/README.md; do
+        [ "$(basename "$script")" = "config.sh" ] && continue
+        cp -pu "$script" "$FLASHPOINT_TARGET_DATA_DIR"
+    done
+    echo "Flashpoint folder already exists at $FLASHPOINT_TARGET_DATA_DIR; refreshed its scripts."
 fi
 
 # Define the target data directory path